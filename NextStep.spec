@@ -0,0 +1,60 @@
+# -*- mode: python ; coding: utf-8 -*-
+"""
+PyInstaller build specification for NextStep.
+
+Builds a one-folder distribution so the bundled modules are not unpacked to a
+temporary directory on every launch, and byte-compiles all pure Python
+modules with optimisation level 2 (equivalent to ``python -OO``) at build
+time. The compiled modules are stored in the single PYZ archive that the
+bootloader loads at startup.
+
+Build with:
+    rcc -binary resources.qrc -o resources.rcc
+    pyinstaller NextStep.spec
+"""
+
+import os
+
+# Prefer the compiled Qt resource bundle; fall back to the loose image files
+if os.path.exists('resources.rcc'):
+    datas = [('resources.rcc', '.')]
+else:
+    datas = [('GG_Icon.png', '.')]
+
+a = Analysis(
+    ['main.py'],
+    pathex=[],
+    binaries=[],
+    datas=datas,
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=[],
+    noarchive=False,
+    optimize=2,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='NextStep',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=False,
+    icon='GG_Icon.ico',
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    name='NextStep',
+)
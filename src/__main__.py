@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Application Launcher Module
+
+Creates the QApplication and main window. Lives inside the package so the
+launcher runs from cached bytecode, whether started through main.py or with
+``python -m src``.
+"""
+
+import sys
+import threading
+
+
+def _import_app_modules():
+    """Import the main application graph ahead of window creation."""
+    try:
+        from . import app
+    except Exception:
+        # The main thread repeats the import and reports the error
+        pass
+
+
+def main():
+    """Main entry point for the Game Progress Tracker application"""
+    # Qt is imported here so importing this module stays cheap
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtGui import QFont
+
+    from .icons import get_icon
+
+    # Load the application modules while Qt performs platform initialisation;
+    # widgets are still only created on the main thread
+    import_thread = threading.Thread(target=_import_app_modules, daemon=True)
+    import_thread.start()
+
+    app = QApplication(sys.argv)
+    
+    # Set application-wide font, skipping the restyle when it is already the default
+    default_font = QApplication.font()
+    desired_font = QFont("Segoe UI", 10)
+    if (default_font.family() != desired_font.family()
+            or default_font.pointSize() != desired_font.pointSize()):
+        app.setFont(desired_font)
+    app.setApplicationName("NextStep")
+    app.setApplicationDisplayName("NextStep")
+
+    app_icon = get_icon("GG_Icon.png")
+    app.setWindowIcon(app_icon)
+
+    # Cheap once the background import is done; surfaces any import error
+    import_thread.join()
+    from .app import GameTrackerApp
+
+    # Create and show the main window
+    window = GameTrackerApp(app_icon=app_icon)
+    window.show()
+
+    # Save state and stop background work however the application quits
+    app.aboutToQuit.connect(window.shutdown)
+
+    # Start the application event loop
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
@@ -5,86 +5,83 @@ AI Management Module
 Handles all AI provider interactions and guide generation logic.
 """
 
+import re
 import json
+import contextlib
 import time
+import random
+import functools
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
 import requests
+from requests.adapters import HTTPAdapter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class AIManager:
-    """Manages AI provider interactions and guide generation"""
-    
-    def __init__(self):
-        self.gemini_models = [
-            "gemini-2.5-flash",
-            "gemini-2.5-flash-exp",
-            "gemini-2.5-latest",
-            "gemini-2.5-lite",
-            "gemini-2.5-lite-latest",
-            "gemini-flash-latest",
-            "gemini-flash-lite-latest",
-            "gemini-2.0-flash",
-            "gemini-2.0-flash-exp",
-            "gemini-2.5-pro",
-        ]
-        self.default_fallback = "No reliable hint could be confirmed from the available guides."
-    
-    def call_ai_api(self, game_title, situation, objective, behavior, api_key, provider, status_callback=None):
-        """Call AI API to generate guide hint"""
-        
-        # Build a more specific prompt for better search results
-        if objective:
-            # If we have an objective, focus on that
-            search_query = f"{game_title} walkthrough guide {situation} {objective}"
-            main_question = f"In the game '{game_title}', the player's current situation is: {situation}. Their immediate objective is: {objective}."
-        else:
-            # If no objective, just use the situation
-            search_query = f"{game_title} walkthrough guide {situation}"
-            main_question = f"In the game '{game_title}', the player's current situation is: {situation}."
-        
-        def log(message):
-            if status_callback and message:
-                status_callback(message)
+# Identical requests within this window reuse the previous result
+RESPONSE_CACHE_TTL = 15 * 60
+RESPONSE_CACHE_SIZE = 32
+# Refined context only depends on the player's notes, so it is kept for the session
+REFINE_CACHE_SIZE = 64
 
-        refined_context = ""
-        if provider == "Gemini":
-            refined_context = self._refine_context_gemini(
-                game_title=game_title,
-                situation=situation,
-                objective=objective,
-                behavior=behavior,
-                api_key=api_key,
-                search_query=search_query,
-                status_callback=log,
-            )
+# (connect, read) timeout shared by every provider call; a dead host fails fast
+REQUEST_TIMEOUT = (5, 30)
 
-        # Build the user prompt
-        prompt_parts = [main_question]
+# Output caps per call: generation needs room, refine and evaluation replies are short.
+# Kept above the bare minimum because a truncated evaluation JSON cannot be parsed.
+GUIDE_MAX_OUTPUT_TOKENS = 500
+REFINE_MAX_OUTPUT_TOKENS = 256
+EVALUATION_MAX_OUTPUT_TOKENS = 160
+# 2.5 models think by default and thinking tokens count against maxOutputTokens.
+# Flash models can switch thinking off; other 2.5 models keep the full guide cap.
+NO_THINKING_MODEL_PREFIX = "gemini-2.5-flash"
+THINKING_MODEL_PREFIX = "gemini-2.5"
 
-        if refined_context:
-            prompt_parts.append(
-                "Verified context from walkthrough research: "
-                f"{refined_context}"
-            )
-            prompt_parts.append(
-                "Cross-check this researched context against the player's own words before making your response."
-            )
-        
-        if behavior:
-            # If there's special behavior instruction, add it
-            prompt_parts.append(behavior)
-        else:
-            # Standard question
-            prompt_parts.append("Search online game guides and walkthroughs to find: What is the EXACT next step the player should take right now?")
-            prompt_parts.append("Provide ONLY the immediate, actionable next step. Be specific and concise.")
-        
-        if not behavior:
-            prompt_parts.append("If you find conflicting information, provide the most commonly recommended solution.")
-        
-        user_prompt = " ".join(prompt_parts)
-        
-        # Enhanced system prompt for accuracy - adjusted based on behavior
-        if behavior and "strategic" in behavior.lower():
-            system_prompt = f"""You are an expert video game guide assistant. Provide comprehensive strategic guidance based on REAL game walkthroughs and guides found online.
+# A model still silent after this long is raced against the next one in line.
+# Well above a normal grounded reply so the common case is never billed twice.
+MODEL_HEDGE_DELAY = 12.0
+
+# Upper bound for a single retry pause before jitter is applied
+MAX_BACKOFF_SECONDS = 8.0
+
+
+def _backoff_delay(base_seconds, attempt):
+    """Exponential retry delay, capped and jittered so clients don't retry in lockstep"""
+    return min(base_seconds * (2 ** attempt), MAX_BACKOFF_SECONDS) * (0.5 + random.random())
+
+
+# HTTP statuses that mean the API key itself was rejected
+AUTH_ERROR_STATUSES = (401, 403)
+
+
+class AuthError(Exception):
+    """Raised when the provider rejects the API key, which no other model can fix"""
+
+
+# Outermost {...} span, which also sees through ```json fences
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.S)
+
+
+def _encode_json(obj):
+    """Serialize a request body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _decode_json(data):
+    """Parse JSON text or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# System prompt templates, specialised by the selected output style
+_STRATEGIC_SYSTEM_PROMPT = """You are an expert video game guide assistant. Provide comprehensive strategic guidance based on REAL game walkthroughs and guides found online.
 
 IMPORTANT INSTRUCTIONS:
 1. Search the internet for "{search_query}" to find accurate walkthrough information
@@ -95,8 +92,8 @@ IMPORTANT INSTRUCTIONS:
 6. Do NOT make up information - only use what you find in guides
 
 Focus on accuracy and helpful structure."""
-        elif behavior and "context" in behavior.lower():
-            system_prompt = f"""You are an expert video game guide assistant. Analyze the player's position in the game based on REAL walkthroughs and guides found online.
+
+_CONTEXT_SYSTEM_PROMPT = """You are an expert video game guide assistant. Analyze the player's position in the game based on REAL walkthroughs and guides found online.
 
 IMPORTANT INSTRUCTIONS:
 1. Search the internet for "{search_query}" to find accurate walkthrough information
@@ -107,8 +104,8 @@ IMPORTANT INSTRUCTIONS:
 6. Do NOT make up information - only use what you find in guides
 
 Focus on contextual understanding over direction."""
-        elif behavior and "tips" in behavior.lower() or behavior and "tricks" in behavior.lower():
-            system_prompt = f"""You are an expert video game guide assistant specializing in tips, tricks, and optimization. Provide helpful secrets and strategies based on REAL game guides and community knowledge.
+
+_TIPS_SYSTEM_PROMPT = """You are an expert video game guide assistant specializing in tips, tricks, and optimization. Provide helpful secrets and strategies based on REAL game guides and community knowledge.
 
 IMPORTANT INSTRUCTIONS:
 1. Search the internet for "{search_query}" along with terms like "tips", "tricks", "secrets", "exploits"
@@ -119,8 +116,8 @@ IMPORTANT INSTRUCTIONS:
 6. Do NOT make up information - only use what you find
 
 Focus on giving them an edge."""
-        else:
-            system_prompt = f"""You are an expert video game guide assistant. Your task is to provide accurate, actionable guidance based on REAL game walkthroughs and guides found online.
+
+_DEFAULT_SYSTEM_PROMPT = """You are an expert video game guide assistant. Your task is to provide accurate, actionable guidance based on REAL game walkthroughs and guides found online.
 
 IMPORTANT INSTRUCTIONS:
 1. Search the internet for "{search_query}" to find accurate walkthrough information
@@ -132,34 +129,170 @@ IMPORTANT INSTRUCTIONS:
 7. Keep your response concise (2-3 sentences max)
 
 Focus on accuracy over creativity. The player needs reliable information."""
-        
+
+# First keyword found in the behavior instruction selects the system prompt
+_STYLE_SYSTEM_PROMPTS = (
+    ("strategic", _STRATEGIC_SYSTEM_PROMPT),
+    ("context", _CONTEXT_SYSTEM_PROMPT),
+    ("tips", _TIPS_SYSTEM_PROMPT),
+    ("tricks", _TIPS_SYSTEM_PROMPT),
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_prompts(game_title, situation, objective, behavior):
+    """Return the search query, question, instructions and system prompt for a request"""
+    # Build a more specific prompt for better search results
+    if objective:
+        # If we have an objective, focus on that
+        search_query = f"{game_title} walkthrough guide {situation} {objective}"
+        main_question = f"In the game '{game_title}', the player's current situation is: {situation}. Their immediate objective is: {objective}."
+    else:
+        # If no objective, just use the situation
+        search_query = f"{game_title} walkthrough guide {situation}"
+        main_question = f"In the game '{game_title}', the player's current situation is: {situation}."
+
+    if behavior:
+        # If there's special behavior instruction, add it
+        instructions = (behavior,)
+    else:
+        # Standard question
+        instructions = (
+            "Search online game guides and walkthroughs to find: What is the EXACT next step the player should take right now?",
+            "Provide ONLY the immediate, actionable next step. Be specific and concise.",
+            "If you find conflicting information, provide the most commonly recommended solution.",
+        )
+
+    # Enhanced system prompt for accuracy - adjusted based on behavior
+    style = behavior.lower() if behavior else ""
+    for keyword, template in _STYLE_SYSTEM_PROMPTS:
+        if keyword in style:
+            break
+    else:
+        template = _DEFAULT_SYSTEM_PROMPT
+    system_prompt = template.format(search_query=search_query)
+
+    return search_query, main_question, instructions, system_prompt
+
+
+class AIManager:
+    """Manages AI provider interactions and guide generation"""
+    
+    def __init__(self):
+        # One session per manager keeps TCP/TLS connections alive between calls
+        self.session = requests.Session()
+        # Room for two raced models' samples plus the evaluation call on one host
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        # Every provider takes JSON bodies, so set the header once for all calls
+        self.session.headers.update({"Content-Type": "application/json"})
+        # Only IDs the v1beta endpoint serves; unknown IDs just burn a 404 round trip
+        self.gemini_models = [
+            "gemini-2.5-flash",
+            "gemini-2.5-flash-lite",
+            "gemini-2.0-flash",
+            "gemini-2.5-pro",
+        ]
+        # Model that last produced guides, tried first on the next request
+        self._preferred_model = None
+        self.default_fallback = "No reliable hint could be confirmed from the available guides."
+        # (game, situation, objective, behavior, provider) -> (timestamp, result)
+        self._response_cache = {}
+        # (game, situation, objective, behavior) -> refined context text
+        self._refine_cache = {}
+        # Cancel events of model races still running, set by close()
+        self._active_races = set()
+
+    def _gemini_model_order(self):
+        """Return the Gemini models to try, starting with the last one that worked"""
+        if self._preferred_model is None:
+            return self.gemini_models
+        return [self._preferred_model] + [m for m in self.gemini_models if m != self._preferred_model]
+
+    def close(self):
+        """Stop outstanding model races and close pooled HTTP connections"""
+        for cancel_event in list(self._active_races):
+            cancel_event.set()
+        self.session.close()
+    
+    def call_ai_api(self, game_title, situation, objective, behavior, api_key, provider, status_callback=None,
+                    use_cache=True):
+        """Call AI API to generate guide hint
+
+        With use_cache=False a fresh answer is generated even if one is cached.
+        """
+        cache_key = (game_title, situation, objective, behavior, provider)
+        cached = self._response_cache.get(cache_key) if use_cache else None
+        if cached and time.monotonic() - cached[0] < RESPONSE_CACHE_TTL:
+            if status_callback:
+                status_callback("Reusing the guide generated for this request a moment ago.")
+            return cached[1]
+
+        search_query, main_question, instructions, system_prompt = _build_prompts(
+            game_title, situation, objective, behavior
+        )
+
+        def log(message):
+            if status_callback and message:
+                status_callback(message)
+
+        refined_context = ""
+        if provider == "Gemini":
+            refined_context = self._refine_context_gemini(
+                game_title=game_title,
+                situation=situation,
+                objective=objective,
+                behavior=behavior,
+                api_key=api_key,
+                search_query=search_query,
+                status_callback=log,
+            )
+
+        # Build the user prompt
+        prompt_parts = [main_question]
+
+        if refined_context:
+            prompt_parts.append(
+                "Verified context from walkthrough research: "
+                f"{refined_context}"
+            )
+            prompt_parts.append(
+                "Cross-check this researched context against the player's own words before making your response."
+            )
+
+        prompt_parts.extend(instructions)
+        user_prompt = " ".join(prompt_parts)
+
         guides = []
         evaluation = {}
         active_model = None
 
         if provider == "Gemini":
             attempts_per_model = 3
-            delay_seconds = 1.5
             last_error = None
 
             log("Starting Gemini guide generation with fallback models...")
 
-            for model_name in self.gemini_models:
-                log(f"Trying model '{model_name}'...")
-                model_guides = []
-                fallback_guide = None
-
-                try:
-                    for attempt in range(attempts_per_model):
-                        batch = self._call_gemini_api(
-                            user_prompt,
-                            system_prompt,
-                            api_key,
-                            model_name=model_name,
-                            status_callback=log,
-                            fallback_text=self.default_fallback,
-                        )
-
+            # Closing the race cancels the losing samples, however the loop exits
+            with contextlib.closing(self._race_gemini_models(
+                user_prompt,
+                system_prompt,
+                api_key,
+                attempts_per_model,
+                status_callback=log,
+            )) as model_results:
+                for model_name, batches, error in model_results:
+                    model_guides = []
+                    fallback_guide = None
+
+                    if isinstance(error, AuthError):
+                        # Every model shares the key, so falling back cannot help
+                        raise error
+                    if error is not None:
+                        last_error = error
+                        log(f"Model '{model_name}' failed: {error}")
+                        continue
+
+                    for batch in batches:
                         for guide in batch:
                             text = (guide.get("text", "") or "").strip()
                             if not text:
@@ -171,48 +304,41 @@ Focus on accuracy over creativity. The player needs reliable information."""
                                 continue
 
                             model_guides.append(guide)
-                            if len(model_guides) >= attempts_per_model:
-                                break
-
-                        if len(model_guides) >= attempts_per_model:
-                            break
 
-                        if attempt < attempts_per_model - 1:
-                            time.sleep(delay_seconds)
-
-                except Exception as exc:
-                    last_error = exc
-                    log(f"Model '{model_name}' failed: {exc}")
-                    continue
-
-                if not model_guides and fallback_guide:
-                    model_guides.append(fallback_guide)
-
-                if model_guides:
-                    guides = model_guides[:attempts_per_model]
-                    active_model = model_name
-                    log(f"Model '{model_name}' succeeded with {len(guides)} guide(s).")
-
-                    if guides:
-                        log("Running reliability evaluation...")
-                        try:
-                            evaluation = self._evaluate_gemini_guides(
-                                game_title=game_title,
-                                situation=situation,
-                                objective=objective,
-                                behavior=behavior,
-                                guides=guides,
-                                api_key=api_key,
-                                model_name=model_name,
-                                status_callback=log
-                            )
-                        except Exception as eval_exc:
-                            log(f"Evaluation step failed: {eval_exc}")
-                            evaluation = {}
-
-                    break
-                else:
-                    log(f"Model '{model_name}' returned no guidance.")
+                    if not model_guides and fallback_guide:
+                        model_guides.append(fallback_guide)
+
+                    if model_guides:
+                        guides = model_guides[:attempts_per_model]
+                        active_model = model_name
+                        self._preferred_model = model_name
+                        log(f"Model '{model_name}' succeeded with {len(guides)} guide(s).")
+
+                        # The evaluation only picks between different hints, so skip it
+                        # when every sample says the same thing
+                        distinct_hints = {" ".join(guide["text"].lower().split()) for guide in guides}
+                        if len(distinct_hints) < 2:
+                            log("All samples agree; skipping reliability evaluation.")
+                        else:
+                            log("Running reliability evaluation...")
+                            try:
+                                evaluation = self._evaluate_gemini_guides(
+                                    game_title=game_title,
+                                    situation=situation,
+                                    objective=objective,
+                                    behavior=behavior,
+                                    guides=guides,
+                                    api_key=api_key,
+                                    model_name=model_name,
+                                    status_callback=log
+                                )
+                            except Exception as eval_exc:
+                                log(f"Evaluation step failed: {eval_exc}")
+                                evaluation = {}
+
+                        break
+                    else:
+                        log(f"Model '{model_name}' returned no guidance.")
 
             if not guides:
                 raise last_error or Exception("All Gemini models failed to provide guidance.")
@@ -236,16 +362,135 @@ Focus on accuracy over creativity. The player needs reliable information."""
         else:
             raise ValueError("Please select a supported AI provider (Gemini, ChatGPT, or Claude).")
 
-        return {
+        result = {
             "guides": guides,
             "provider": provider,
             "evaluation": evaluation,
             "model_used": active_model if provider == "Gemini" else None,
             "refined_context": refined_context,
         }
+        # A fallback-only answer is worth retrying, so it is never replayed
+        if any(guide["text"] != self.default_fallback for guide in guides):
+            self._cache_response(cache_key, result)
+        return result
+
+    def _cache_response(self, cache_key, result):
+        """Remember a generated result, evicting the oldest entries beyond the cap"""
+        self._response_cache.pop(cache_key, None)
+        self._response_cache[cache_key] = (time.monotonic(), result)
+        while len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            del self._response_cache[next(iter(self._response_cache))]
     
+    def _race_gemini_models(self, user_prompt, system_prompt, api_key, count, status_callback=None):
+        """Yield (model, batches, error) as models finish, hedging a slow model with the next"""
+        models = iter(self._gemini_model_order())
+        executor = ThreadPoolExecutor(max_workers=2)
+        pending = {}
+        # Set once the caller stops listening; losing samples stop retrying and go quiet
+        cancel_event = threading.Event()
+        self._active_races.add(cancel_event)
+
+        def report(message):
+            if status_callback and not cancel_event.is_set():
+                status_callback(message)
+
+        def launch():
+            model_name = next(models, None)
+            if model_name is None:
+                return False
+            report(f"Trying model '{model_name}'...")
+            future = executor.submit(
+                self._sample_gemini_guides,
+                user_prompt,
+                system_prompt,
+                api_key,
+                model_name,
+                count,
+                status_callback=report,
+                cancel_event=cancel_event,
+            )
+            pending[future] = model_name
+            return True
+
+        # Models run one at a time until one turns out slow, then two at a time
+        slots = 1
+        try:
+            more_models = launch()
+            while pending:
+                hedge = more_models and slots == 1
+                done, _ = wait(pending, timeout=MODEL_HEDGE_DELAY if hedge else None, return_when=FIRST_COMPLETED)
+                if not done:
+                    report("Model is slow to respond; racing the next model alongside it...")
+                    slots = 2
+                    more_models = launch()
+                    continue
+
+                for future in done:
+                    model_name = pending.pop(future)
+                    try:
+                        batches, error = future.result(), None
+                    except Exception as exc:
+                        batches, error = None, exc
+                    yield model_name, batches, error
+
+                while more_models and len(pending) < slots:
+                    more_models = launch()
+        finally:
+            # A request already in flight can't be interrupted, but its retries are skipped
+            cancel_event.set()
+            self._active_races.discard(cancel_event)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _pause(seconds, cancel_event=None):
+        """Sleep between retries, waking early if the request is cancelled"""
+        if cancel_event is None:
+            time.sleep(seconds)
+        else:
+            cancel_event.wait(seconds)
+
+    def _sample_gemini_guides(self, user_prompt, system_prompt, api_key, model_name, count, status_callback=None,
+                              cancel_event=None):
+        """Request count independent guide samples from one model concurrently"""
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            futures = [
+                executor.submit(
+                    self._call_gemini_api,
+                    user_prompt,
+                    system_prompt,
+                    api_key,
+                    model_name=model_name,
+                    status_callback=status_callback,
+                    fallback_text=self.default_fallback,
+                    cancel_event=cancel_event,
+                )
+                for _ in range(count)
+            ]
+
+        batches = []
+        errors = []
+        for future in futures:
+            try:
+                batches.append(future.result())
+            except Exception as exc:
+                errors.append(exc)
+
+        # The model only counts as failed when every sample failed
+        if not batches and errors:
+            auth_errors = [exc for exc in errors if isinstance(exc, AuthError)]
+            raise (auth_errors or errors)[-1]
+        return batches
+
     def _refine_context_gemini(self, game_title, situation, objective, behavior, api_key, search_query, status_callback=None):
         """Gather additional context from guides before generating next steps"""
+        cache_key = (game_title, situation, objective or "", behavior or "")
+        cached = self._refine_cache.pop(cache_key, None)
+        if cached:
+            # Re-insert so the entry counts as most recently used
+            self._refine_cache[cache_key] = cached
+            if status_callback:
+                status_callback("Reusing walkthrough research for these notes.")
+            return cached
 
         if status_callback:
             status_callback("Refining player request using walkthrough research...")
@@ -281,10 +526,13 @@ Focus on accuracy over creativity. The player needs reliable information."""
                 user_prompt=user_prompt,
                 system_prompt=system_prompt,
                 api_key=api_key,
-                model_name=self.gemini_models[0],
+                model_name=self._gemini_model_order()[0],
                 status_callback=status_callback,
                 fallback_text=None,
+                max_output_tokens=REFINE_MAX_OUTPUT_TOKENS,
             )
+        except AuthError:
+            raise
         except Exception as exc:
             if status_callback:
                 status_callback(f"Context refinement skipped: {exc}")
@@ -293,12 +541,30 @@ Focus on accuracy over creativity. The player needs reliable information."""
         for candidate in results:
             text = (candidate.get("text", "") or "").strip()
             if text:
+                self._refine_cache[cache_key] = text
+                while len(self._refine_cache) > REFINE_CACHE_SIZE:
+                    del self._refine_cache[next(iter(self._refine_cache))]
                 return text
 
         return ""
 
-    def _call_gemini_api(self, user_prompt, system_prompt, api_key, model_name, status_callback=None, fallback_text=None):
+    def _call_gemini_api(self, user_prompt, system_prompt, api_key, model_name, status_callback=None, fallback_text=None,
+                         max_output_tokens=GUIDE_MAX_OUTPUT_TOKENS, cancel_event=None):
         """Call Google Gemini API with Google Search grounding"""
+        generation_config = {
+            "candidateCount": 1,
+            "temperature": 0.3,  # Lower temperature for more factual responses
+            "topP": 0.8,
+            "topK": 20,
+        }
+        if max_output_tokens < GUIDE_MAX_OUTPUT_TOKENS:
+            if model_name.startswith(NO_THINKING_MODEL_PREFIX):
+                # Spend the short cap on the reply rather than on thinking
+                generation_config["thinkingConfig"] = {"thinkingBudget": 0}
+            elif model_name.startswith(THINKING_MODEL_PREFIX):
+                max_output_tokens = GUIDE_MAX_OUTPUT_TOKENS
+        generation_config["maxOutputTokens"] = max_output_tokens
+
         api_url = f"https://generativelanguage.googleapis.com/v1beta/models/{model_name}:generateContent?key={api_key}"
         
         payload = {
@@ -307,13 +573,7 @@ Focus on accuracy over creativity. The player needs reliable information."""
             "systemInstruction": {
                 "parts": [{"text": system_prompt}]
             },
-            "generationConfig": {
-                "candidateCount": 1,
-                "temperature": 0.3,  # Lower temperature for more factual responses
-                "topP": 0.8,
-                "topK": 20,
-                "maxOutputTokens": 500
-            }
+            "generationConfig": generation_config
         }
 
         max_retries = 3
@@ -321,20 +581,21 @@ Focus on accuracy over creativity. The player needs reliable information."""
         response = None
 
         for attempt in range(max_retries):
+            if cancel_event is not None and cancel_event.is_set():
+                raise Exception(f"Request to '{model_name}' cancelled.")
             if status_callback:
                 status_callback(f"Sending request to '{model_name}' (attempt {attempt + 1}/{max_retries})...")
             try:
-                response = requests.post(
+                response = self.session.post(
                     api_url,
-                    headers={"Content-Type": "application/json"},
-                    json=payload,
-                    timeout=30
+                    data=_encode_json(payload),
+                    timeout=REQUEST_TIMEOUT
                 )
             except requests.RequestException as exc:
                 if attempt < max_retries - 1:
                     if status_callback:
                         status_callback(f"Request to '{model_name}' failed ({exc}). Retrying...")
-                    time.sleep(backoff_seconds * (attempt + 1))
+                    self._pause(_backoff_delay(backoff_seconds, attempt), cancel_event)
                     continue
                 raise Exception(f"Failed to reach Gemini API: {exc}") from exc
 
@@ -344,23 +605,27 @@ Focus on accuracy over creativity. The player needs reliable information."""
             if response.status_code in (429, 500, 502, 503) and attempt < max_retries - 1:
                 if status_callback:
                     status_callback(f"Received {response.status_code} from '{model_name}'. Retrying after backoff...")
-                time.sleep(backoff_seconds * (attempt + 1))
+                self._pause(_backoff_delay(backoff_seconds, attempt), cancel_event)
                 continue
 
+            if response.status_code in AUTH_ERROR_STATUSES or "API_KEY_INVALID" in response.text:
+                # Gemini reports a bad key as 400 INVALID_ARGUMENT with this reason
+                raise AuthError(f"API key rejected ({response.status_code}): {response.text}")
             raise Exception(f"API returned status {response.status_code}: {response.text}")
 
         if response is None:
             raise Exception("No response from Gemini API.")
 
-        result = response.json()
+        result = _decode_json(response.content)
 
         guides = []
         candidates = result.get("candidates", [])
 
         for candidate in candidates:
-            content = candidate.get("content", {})
-            parts = content.get("parts", [{}])
-            text = parts[0].get("text", "").strip()
+            content = candidate.get("content") or {}
+            # Grounded replies can arrive split across several parts
+            parts = content.get("parts") or []
+            text = "".join(part.get("text") or "" for part in parts).strip()
 
             if not text:
                 continue
@@ -369,23 +634,19 @@ Focus on accuracy over creativity. The player needs reliable information."""
             grounding_metadata = candidate.get("groundingMetadata", {})
             attributions = grounding_metadata.get("groundingAttributions", [])
 
-            sources = set()
-            seen_uris = set()
+            # Keyed by URI: one pass dedupes while keeping the citation order
+            sources = {}
             for attr in attributions:
-                web = attr.get("web", {})
-                title = web.get("title", "").strip()
-                uri = web.get("uri", "").strip()
-                if not uri or uri in seen_uris:
+                web = attr.get("web") or {}
+                uri = (web.get("uri") or "").strip()
+                if not uri or uri in sources:
                     continue
-                seen_uris.add(uri)
-                if title:
-                    sources.add(f"{title} — {uri}")
-                else:
-                    sources.add(uri)
+                title = (web.get("title") or "").strip()
+                sources[uri] = f"{title} — {uri}" if title else uri
 
             guides.append({
                 "text": text,
-                "sources": list(sources)
+                "sources": list(sources.values())
             })
 
         if not guides and fallback_text:
@@ -406,12 +667,12 @@ Focus on accuracy over creativity. The player needs reliable information."""
 
         guide_lines = []
         for idx, guide in enumerate(guides, start=1):
-            text = (guide.get("text", "") or "").strip().replace("\\n", " ")
+            text = (guide.get("text", "") or "").strip().replace("\n", " ")
             sources = guide.get("sources", [])
             source_text = "; ".join(sources) if sources else "No sources provided."
-            guide_lines.append(f"Guide {idx}:\\nHint: {text}\\nSources: {source_text}")
+            guide_lines.append(f"Guide {idx}:\nHint: {text}\nSources: {source_text}")
 
-        guides_block = "\\n\\n".join(guide_lines)
+        guides_block = "\n\n".join(guide_lines)
 
         user_prompt = f"""You are verifying hints for the game '{game_title}'.
 Current situation: {situation}
@@ -441,7 +702,8 @@ Return only valid JSON that matches the requested schema."""
             api_key,
             model_name,
             status_callback=status_callback,
-            fallback_text=None
+            fallback_text=None,
+            max_output_tokens=EVALUATION_MAX_OUTPUT_TOKENS
         )
         if not evaluation_results:
             return {}
@@ -450,24 +712,11 @@ Return only valid JSON that matches the requested schema."""
         if not raw_text:
             return {}
 
-        cleaned_text = raw_text.strip()
-
-        if cleaned_text.startswith("```"):
-            cleaned_text = cleaned_text[3:]
-            if cleaned_text.lower().startswith("json"):
-                cleaned_text = cleaned_text[4:]
-            cleaned_text = cleaned_text.strip()
-            if cleaned_text.endswith("```"):
-                cleaned_text = cleaned_text[:-3].strip()
-
-        if not cleaned_text.startswith("{"):
-            start = cleaned_text.find("{")
-            end = cleaned_text.rfind("}")
-            if start != -1 and end != -1 and end > start:
-                cleaned_text = cleaned_text[start:end + 1]
+        match = _JSON_OBJECT_RE.search(raw_text)
+        cleaned_text = match.group(0) if match else raw_text
 
         try:
-            parsed = json.loads(cleaned_text)
+            parsed = _decode_json(cleaned_text)
         except json.JSONDecodeError:
             return {
                 "recommended_index": 0,
@@ -491,20 +740,19 @@ Return only valid JSON that matches the requested schema."""
             "max_tokens": 500
         }
         
-        response = requests.post(
+        response = self.session.post(
             api_url,
             headers={
-                "Content-Type": "application/json",
                 "Authorization": f"Bearer {api_key}"
             },
-            json=payload,
-            timeout=30
+            data=_encode_json(payload),
+            timeout=REQUEST_TIMEOUT
         )
         
         if response.status_code != 200:
             raise Exception(f"API returned status {response.status_code}: {response.text}")
         
-        result = response.json()
+        result = _decode_json(response.content)
         text = result.get("choices", [{}])[0].get("message", {}).get("content", "Could not generate a hint.")
         
         return text
@@ -522,21 +770,20 @@ Return only valid JSON that matches the requested schema."""
             ]
         }
         
-        response = requests.post(
+        response = self.session.post(
             api_url,
             headers={
-                "Content-Type": "application/json",
                 "x-api-key": api_key,
                 "anthropic-version": "2023-06-01"
             },
-            json=payload,
-            timeout=30
+            data=_encode_json(payload),
+            timeout=REQUEST_TIMEOUT
         )
         
         if response.status_code != 200:
             raise Exception(f"API returned status {response.status_code}: {response.text}")
         
-        result = response.json()
+        result = _decode_json(response.content)
         text = result.get("content", [{}])[0].get("text", "Could not generate a hint.")
         
         return text
\ No newline at end of file
@@ -6,16 +6,19 @@ from the monolithic version while delegating persistence and AI calls to
 modular helpers.
 """
 
+import bisect
+import collections
+import contextlib
+import functools
+
 from PyQt6.QtWidgets import (
     QMainWindow,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QPushButton,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QLabel,
-    QTextEdit,
     QTextBrowser,
     QPlainTextEdit,
     QLineEdit,
@@ -29,36 +32,248 @@ from PyQt6.QtWidgets import (
     QMenu,
     QSizePolicy,
 )
-from PyQt6.QtCore import Qt, QThread
-from PyQt6.QtGui import QFont, QIcon, QAction, QKeySequence, QShortcut
+from PyQt6.QtCore import QModelIndex, Qt, QThreadPool, QTimer, pyqtSlot
+from PyQt6.QtGui import QFont, QAction, QKeySequence, QShortcut
 
 import markdown
 
 from .data import DataManager
 from .ai import AIManager
-from .workers import GuideGenerationWorker
+from .workers import GuideGenerationWorker, LibraryLoadWorker
 from .dialogs import AddGameDialog
+from .models import GameListModel
+
+# Oldest processing status lines are dropped beyond this many
+STATUS_LOG_MAX_LINES = 200
+
+
+@contextlib.contextmanager
+def _updates_paused(widget):
+    """Suspend repaints of widget so a batch of changes shows up in one paint"""
+    if not widget.updatesEnabled():
+        # An outer block already paused updates and will repaint
+        yield
+        return
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(True)
+        widget.update()
+
+
+@contextlib.contextmanager
+def _signals_blocked(*widgets):
+    """Block signals from widgets for a block, restoring their previous state"""
+    previous = [widget.blockSignals(True) for widget in widgets]
+    try:
+        yield
+    finally:
+        for widget, was_blocked in zip(widgets, previous):
+            widget.blockSignals(was_blocked)
+
+
+# Colour palette for each theme, substituted into _STYLESHEET_TEMPLATE
+THEME_PALETTES = {
+    "Dark": {
+        "bg_main": "#1e1e1e",
+        "bg_panel": "#252526",
+        "bg_input": "#2d2d30",
+        "bg_list": "#2d2d30",
+        "text_primary": "#e0e0e0",
+        "text_secondary": "#ffffff",
+        "border_color": "#3e3e42",
+        "hover_bg": "#3e3e42",
+        "selected_bg": "#094771",
+        "selected_text": "#60cdff",
+        "scrollbar_bg": "#3e3e42",
+        "scrollbar_handle": "#686868",
+        "scrollbar_hover": "#9e9e9e",
+    },
+    "Light": {
+        "bg_main": "#f9f9f9",
+        "bg_panel": "#ffffff",
+        "bg_input": "#ffffff",
+        "bg_list": "#fafafa",
+        "text_primary": "#202020",
+        "text_secondary": "#202020",
+        "border_color": "#e0e0e0",
+        "hover_bg": "#f0f0f0",
+        "selected_bg": "#e3f2fd",
+        "selected_text": "#0078d4",
+        "scrollbar_bg": "#f0f0f0",
+        "scrollbar_handle": "#c0c0c0",
+        "scrollbar_hover": "#a0a0a0",
+    },
+    "Cyberpunk": {
+        "bg_main": "#0a0e27",
+        "bg_panel": "#131629",
+        "bg_input": "#1a1f3a",
+        "bg_list": "#1a1f3a",
+        "text_primary": "#00ffff",
+        "text_secondary": "#ff00ff",
+        "border_color": "#ff00ff",
+        "hover_bg": "#1f2544",
+        "selected_bg": "#2d1b69",
+        "selected_text": "#00ffff",
+        "scrollbar_bg": "#1f2544",
+        "scrollbar_handle": "#ff00ff",
+        "scrollbar_hover": "#00ffff",
+    },
+    "Retro": {
+        "bg_main": "#2b2b2b",
+        "bg_panel": "#1a1a1a",
+        "bg_input": "#0f0f0f",
+        "bg_list": "#0f0f0f",
+        "text_primary": "#33ff33",
+        "text_secondary": "#33ff33",
+        "border_color": "#33ff33",
+        "hover_bg": "#3a3a3a",
+        "selected_bg": "#004400",
+        "selected_text": "#66ff66",
+        "scrollbar_bg": "#3a3a3a",
+        "scrollbar_handle": "#33ff33",
+        "scrollbar_hover": "#66ff66",
+    },
+    "Gaming": {
+        # Zelda-inspired green theme
+        "bg_main": "#1a3a1a",
+        "bg_panel": "#2d5a2d",
+        "bg_input": "#1e4a1e",
+        "bg_list": "#1e4a1e",
+        "text_primary": "#f5f5dc",
+        "text_secondary": "#ffffff",
+        "border_color": "#5c8a5c",
+        "hover_bg": "#3d6a3d",
+        "selected_bg": "#4d7a4d",
+        "selected_text": "#ffeb3b",
+        "scrollbar_bg": "#3d6a3d",
+        "scrollbar_handle": "#5c8a5c",
+        "scrollbar_hover": "#7caa7c",
+    },
+}
+
+# Window stylesheet with {palette_key} placeholders; braces in rules are doubled
+_STYLESHEET_TEMPLATE = """\
+QMainWindow {{ background-color: {bg_main}; }}
+QWidget {{ background-color: {bg_main}; color: {text_primary}; }}
+QFrame {{ background-color: {bg_panel}; border: 1px solid {border_color}; }}
+QFrame#statusPanel {{ border: 1px dashed {border_color}; background-color: {bg_panel}; }}
+QLabel {{ color: {text_primary}; background-color: transparent; border: none; }}
+QListView {{ background-color: {bg_list}; border: 1px solid {border_color}; border-radius: 6px; padding: 5px; outline: none; color: {text_primary}; }}
+QListView::item {{ padding: 12px; border-radius: 4px; margin: 2px; color: {text_primary}; }}
+QListView::item:selected {{ background-color: {selected_bg}; color: {selected_text}; }}
+QListView::item:hover {{ background-color: {hover_bg}; color: {text_primary}; }}
+QPlainTextEdit {{ border: 2px solid {border_color}; border-radius: 6px; padding: 10px; background-color: {bg_input}; color: {text_primary}; }}
+QPlainTextEdit:focus {{ border: 2px solid #0078d4; }}
+QTextBrowser {{ border: 2px solid {border_color}; border-radius: 6px; padding: 10px; background-color: {bg_input}; color: {text_primary}; }}
+QTextBrowser:focus {{ border: 2px solid #0078d4; }}
+QTextBrowser#viewGuideText {{ border: none; background-color: transparent; padding: 0px; }}
+QPlainTextEdit#statusDisplay {{ border: 1px solid {border_color}; border-radius: 6px; padding: 8px; background-color: {bg_panel}; color: {text_primary}; }}
+QPlainTextEdit#statusDisplay:focus {{ border: 1px solid {border_color}; }}
+QScrollArea {{ border: none; background-color: {bg_panel}; }}
+QScrollArea > QWidget > QWidget {{ background-color: {bg_panel}; }}
+QScrollBar:vertical {{ border: none; background: {scrollbar_bg}; width: 10px; border-radius: 5px; }}
+QScrollBar::handle:vertical {{ background: {scrollbar_handle}; border-radius: 5px; min-height: 20px; }}
+QScrollBar::handle:vertical:hover {{ background: {scrollbar_hover}; }}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0px; }}
+QPushButton {{ background-color: #0078d4; color: white; border: none; border-radius: 6px; padding: 10px 20px; }}
+QPushButton:hover {{ background-color: #006cbd; }}
+QPushButton:pressed {{ background-color: #005a9e; }}
+QPushButton:disabled {{ background-color: #cccccc; color: #666666; }}
+QPushButton#deleteButton {{ background-color: #d32f2f; }}
+QPushButton#deleteButton:hover {{ background-color: #b71c1c; }}
+QPushButton#sortOrderButton {{ background-color: {bg_input}; color: {text_primary}; border: 1px solid {border_color}; border-radius: 4px; padding: 0px; }}
+QPushButton#sortOrderButton:hover {{ background-color: {hover_bg}; }}
+QToolButton#sortButton {{ background-color: {bg_input}; color: {text_primary}; border: 1px solid {border_color}; border-radius: 4px; padding: 5px 12px; }}
+QToolButton#sortButton:hover {{ background-color: {hover_bg}; }}
+QToolButton#sortButton::menu-indicator {{ image: none; width: 0px; }}
+QComboBox {{ background-color: {bg_input}; color: {text_primary}; border: 2px solid {border_color}; border-radius: 4px; padding: 5px; }}
+QComboBox:hover {{ border: 2px solid #0078d4; }}
+QComboBox::drop-down {{ border: none; }}
+QComboBox::down-arrow {{ image: none; border-left: 4px solid transparent; border-right: 4px solid transparent; border-top: 5px solid {text_primary}; margin-right: 5px; }}
+QComboBox QAbstractItemView {{ background-color: {bg_input}; color: {text_primary}; selection-background-color: {selected_bg}; selection-color: {selected_text}; border: 1px solid {border_color}; }}
+QLineEdit {{ background-color: {bg_input}; color: {text_primary}; border: 2px solid {border_color}; border-radius: 4px; padding: 5px; }}
+QLineEdit:focus {{ border: 2px solid #0078d4; }}
+QDialog#addGameDialog {{ background-color: #f3f3f3; }}
+QDialog#addGameDialog QLabel {{ color: #202020; }}
+QDialog#addGameDialog QLineEdit#titleInput {{ padding: 10px; border: 2px solid #e0e0e0; border-radius: 6px; background-color: white; color: #202020; }}
+QDialog#addGameDialog QLineEdit#titleInput:focus {{ border: 2px solid #0078d4; }}
+QDialog#addGameDialog QPushButton#cancelButton {{ padding: 8px 20px; border: 1px solid #d0d0d0; border-radius: 4px; background-color: white; color: #202020; }}
+QDialog#addGameDialog QPushButton#cancelButton:hover {{ background-color: #f0f0f0; }}
+QDialog#addGameDialog QPushButton#primaryButton {{ padding: 8px 20px; border: none; border-radius: 4px; background-color: #0078d4; color: white; }}
+QDialog#addGameDialog QPushButton#primaryButton:hover {{ background-color: #006cbd; }}
+QDialog#addGameDialog QPushButton#primaryButton:pressed {{ background-color: #005a9e; }}
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _build_stylesheet(current_theme):
+    """Fill the stylesheet template with a theme's palette (cached per theme name)"""
+    return _STYLESHEET_TEMPLATE.format_map(THEME_PALETTES[current_theme])
 
 
 class GameTrackerApp(QMainWindow):
     """Main application window coordinating UI, storage, and AI calls"""
 
-    def __init__(self, app_icon_path=None):
+    # Shared fonts, created once a QApplication exists (see _init_fonts)
+    FONT_SMALL = None
+    FONT_BODY = None
+    FONT_BODY_BOLD = None
+    FONT_LABEL = None
+    FONT_SECTION = None
+    FONT_HEADER = None
+    FONT_TITLE = None
+    FONT_ICON = None
+
+    def __init__(self, app_icon=None):
         super().__init__()
 
         # Managers
         self.data_manager = DataManager()
         self.ai_manager = AIManager()
 
-        # State
-        self.games = self.data_manager.load_games()
+        # State; the library itself is read in the background once the window exists
+        self.games = {}
+        self._library_loaded = False
+        self._library_loader = None
+        # Alphabetical title index kept in step with self.games
+        self._sorted_titles = []
+        self._sorted_keys = []
         self.settings = self.data_manager.load_settings()
         self.current_game = None
         self.is_edit_mode = False
-        self._status_messages = []
-        self.current_worker_thread = None
+        self._status_messages = collections.deque(maxlen=STATUS_LOG_MAX_LINES)
+        # Status lines received but not yet shown; flushed together by _status_timer
+        self._pending_status = []
         self.current_worker = None
-        self.app_icon_path = app_icon_path
+        # Inputs of the last guide request; asking again with the same inputs skips the cache
+        self._last_guide_request = None
+        self.thread_pool = QThreadPool.globalInstance()
+        # One add/rename dialog, created on first use and reconfigured each time
+        self._title_dialog = None
+        self.app_icon = app_icon
+
+        # Coalesce API key edits into a single encrypt + write once typing stops
+        self._api_save_timer = QTimer(self)
+        self._api_save_timer.setSingleShot(True)
+        self._api_save_timer.setInterval(500)
+        self._api_save_timer.timeout.connect(self._flush_api_key)
+        # Plaintext API key kept in memory so generating a guide needs no decrypt
+        self._api_key_plain = ""
+        self._api_settings_loaded = False
+
+        # Coalesce bursts of game edits into a single library write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_save)
+
+        # Coalesce bursts of worker status messages into one append
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self._flush_status)
 
         # Theme management
         self.themes = ["Dark", "Light", "Cyberpunk", "Retro", "Gaming"]
@@ -76,18 +291,35 @@ class GameTrackerApp(QMainWindow):
         # Window setup
         self.setWindowTitle("NextStep v2.0")
         self.setMinimumSize(1000, 600)
-        if self.app_icon_path:
-            self.setWindowIcon(QIcon(self.app_icon_path))
+        if self.app_icon is not None:
+            self.setWindowIcon(self.app_icon)
 
         self._build_ui()
         self._setup_shortcuts()
         self._apply_styles()
-        self._load_api_settings()
+        # Decrypting the stored key loads the cryptography stack, so run it after show()
+        QTimer.singleShot(0, self._load_api_settings)
+        self._start_library_load()
 
     # ------------------------------------------------------------------
     # UI construction
     # ------------------------------------------------------------------
+    @classmethod
+    def _init_fonts(cls):
+        if cls.FONT_BODY is not None:
+            return
+        cls.FONT_SMALL = QFont("Segoe UI", 9)
+        cls.FONT_BODY = QFont("Segoe UI", 10)
+        cls.FONT_BODY_BOLD = QFont("Segoe UI", 10, QFont.Weight.Bold)
+        cls.FONT_LABEL = QFont("Segoe UI", 11, QFont.Weight.Bold)
+        cls.FONT_SECTION = QFont("Segoe UI", 12, QFont.Weight.Bold)
+        cls.FONT_HEADER = QFont("Segoe UI", 14, QFont.Weight.Bold)
+        cls.FONT_TITLE = QFont("Segoe UI", 16, QFont.Weight.Bold)
+        cls.FONT_ICON = QFont("Segoe UI", 16)
+
     def _build_ui(self):
+        self._init_fonts()
+
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
 
@@ -124,19 +356,23 @@ class GameTrackerApp(QMainWindow):
         self._shortcut_delete_game.setContext(Qt.ShortcutContext.WidgetShortcut)
         self._shortcut_delete_game.activated.connect(self._handle_delete_game_shortcut)
 
+    @pyqtSlot()
     def _handle_add_game_shortcut(self):
         self._add_new_game()
 
+    @pyqtSlot()
     def _handle_enter_edit_shortcut(self):
         if not self.current_game or self.is_edit_mode:
             return
         self._enter_edit_mode()
 
+    @pyqtSlot()
     def _handle_exit_edit_shortcut(self):
         if not self.current_game or not self.is_edit_mode:
             return
         self._exit_edit_mode()
 
+    @pyqtSlot()
     def _handle_delete_game_shortcut(self):
         if not self.current_game:
             return
@@ -154,7 +390,7 @@ class GameTrackerApp(QMainWindow):
         self.sort_button = QToolButton()
         self.sort_button.setObjectName("sortButton")
         self.sort_button.setText("Sort by")
-        self.sort_button.setFont(QFont("Segoe UI", 10))
+        self.sort_button.setFont(self.FONT_BODY)
         self.sort_button.setFixedSize(120, 35)
         self.sort_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.sort_button.setToolTip("Choose how to sort your game library")
@@ -184,7 +420,7 @@ class GameTrackerApp(QMainWindow):
         # Sort order toggle button with arrow icons
         self.sort_order_button = QPushButton()
         self.sort_order_button.setObjectName("sortOrderButton")
-        self.sort_order_button.setFont(QFont("Segoe UI", 16))
+        self.sort_order_button.setFont(self.FONT_ICON)
         self.sort_order_button.setFixedSize(35, 35)
         self.sort_order_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.sort_order_button.clicked.connect(self._toggle_sort_order)
@@ -195,7 +431,7 @@ class GameTrackerApp(QMainWindow):
 
         # Theme dropdown
         self.theme_combo = QComboBox()
-        self.theme_combo.setFont(QFont("Segoe UI", 10))
+        self.theme_combo.setFont(self.FONT_BODY)
         self.theme_combo.setFixedSize(150, 35)
         self.theme_combo.setCursor(Qt.CursorShape.PointingHandCursor)
         self.theme_combo.addItems([
@@ -213,17 +449,17 @@ class GameTrackerApp(QMainWindow):
 
         # AI Provider label
         ai_label = QLabel("AI Provider: Gemini")
-        ai_label.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+        ai_label.setFont(self.FONT_BODY_BOLD)
         layout.addWidget(ai_label)
 
         # API Key input
         api_label = QLabel("API Key:")
-        api_label.setFont(QFont("Segoe UI", 10))
+        api_label.setFont(self.FONT_BODY)
         layout.addWidget(api_label)
 
         self.api_key_input = QLineEdit()
         self.api_key_input.setPlaceholderText("Enter your API key...")
-        self.api_key_input.setFont(QFont("Segoe UI", 10))
+        self.api_key_input.setFont(self.FONT_BODY)
         self.api_key_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.api_key_input.setFixedWidth(250)
         self.api_key_input.textChanged.connect(self._on_api_key_changed)
@@ -242,23 +478,29 @@ class GameTrackerApp(QMainWindow):
         layout.setSpacing(12)
 
         header_label = QLabel("📚 Game Library")
-        header_label.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
+        header_label.setFont(self.FONT_HEADER)
         header_label.setWordWrap(True)
         layout.addWidget(header_label)
 
-        self.game_list = QListWidget()
-        self.game_list.setFont(QFont("Segoe UI", 10))
-        self.game_list.itemClicked.connect(self._on_game_selected)
-        self.game_list.itemDoubleClicked.connect(self._rename_game)
+        self.game_model = GameListModel(self.games, self)
+        self.game_list = QListView()
+        self.game_list.setModel(self.game_model)
+        self.game_list.setFont(self.FONT_BODY)
+        self.game_list.setUniformItemSizes(True)
+        self.game_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.game_list.clicked.connect(self._on_game_selected)
+        self.game_list.doubleClicked.connect(self._rename_game)
         self._populate_game_list()
         layout.addWidget(self.game_list, stretch=1)
 
-        add_button = QPushButton("➕ Add New Game")
-        add_button.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        add_button.setCursor(Qt.CursorShape.PointingHandCursor)
-        add_button.setMinimumHeight(40)
-        add_button.clicked.connect(self._add_new_game)
-        layout.addWidget(add_button)
+        self.add_button = QPushButton("➕ Add New Game")
+        self.add_button.setFont(self.FONT_BODY_BOLD)
+        self.add_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.add_button.setMinimumHeight(40)
+        # Enabled once the saved library has been loaded
+        self.add_button.setEnabled(False)
+        self.add_button.clicked.connect(self._add_new_game)
+        layout.addWidget(self.add_button)
 
         panel.setLayout(layout)
         return panel
@@ -271,28 +513,32 @@ class GameTrackerApp(QMainWindow):
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
         scroll_area.setFrameShape(QFrame.Shape.NoFrame)
+        # Labels word-wrap to the panel width, so only vertical overflow can occur
+        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
 
         content_widget = QWidget()
+        self._details_content = content_widget
         layout = QVBoxLayout()
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(15)
 
         self.game_title_label = QLabel("")
-        self.game_title_label.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        self.game_title_label.setFont(self.FONT_TITLE)
         self.game_title_label.setWordWrap(True)
         self.game_title_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         layout.addWidget(self.game_title_label)
 
         # View mode: Status as label
         self.view_status_label = QLabel("🎮 Status:")
-        self.view_status_label.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        self.view_status_label.setFont(self.FONT_LABEL)
         self.view_status_label.setWordWrap(True)
         self.view_status_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         self.view_status_label.setContentsMargins(0, 5, 0, 0)
         layout.addWidget(self.view_status_label)
 
         self.view_status_text = QLabel("")
-        self.view_status_text.setFont(QFont("Segoe UI", 10))
+        self.view_status_text.setFont(self.FONT_BODY)
         self.view_status_text.setWordWrap(True)
         self.view_status_text.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
         self.view_status_text.setContentsMargins(0, 0, 0, 5)
@@ -305,14 +551,14 @@ class GameTrackerApp(QMainWindow):
         layout.addWidget(self.divider)
 
         self.view_situation_label = QLabel("📝 Current Situation")
-        self.view_situation_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        self.view_situation_label.setFont(self.FONT_SECTION)
         self.view_situation_label.setWordWrap(True)
         self.view_situation_label.setContentsMargins(0, 10, 0, 5)
         self.view_situation_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         layout.addWidget(self.view_situation_label)
 
         self.view_situation_text = QLabel("")
-        self.view_situation_text.setFont(QFont("Segoe UI", 10))
+        self.view_situation_text.setFont(self.FONT_BODY)
         self.view_situation_text.setWordWrap(True)
         self.view_situation_text.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
         self.view_situation_text.setContentsMargins(0, 0, 0, 10)
@@ -320,14 +566,14 @@ class GameTrackerApp(QMainWindow):
         layout.addWidget(self.view_situation_text)
 
         self.view_objective_label = QLabel("🎯 Next Objective")
-        self.view_objective_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        self.view_objective_label.setFont(self.FONT_SECTION)
         self.view_objective_label.setWordWrap(True)
         self.view_objective_label.setContentsMargins(0, 10, 0, 5)
         self.view_objective_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         layout.addWidget(self.view_objective_label)
 
         self.view_objective_text = QLabel("")
-        self.view_objective_text.setFont(QFont("Segoe UI", 10))
+        self.view_objective_text.setFont(self.FONT_BODY)
         self.view_objective_text.setWordWrap(True)
         self.view_objective_text.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
         self.view_objective_text.setContentsMargins(0, 0, 0, 10)
@@ -335,7 +581,7 @@ class GameTrackerApp(QMainWindow):
         layout.addWidget(self.view_objective_text)
 
         self.view_guide_label = QLabel("💡 Guide Hint")
-        self.view_guide_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        self.view_guide_label.setFont(self.FONT_SECTION)
         self.view_guide_label.setWordWrap(True)
         self.view_guide_label.setContentsMargins(0, 10, 0, 5)
         self.view_guide_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
@@ -343,60 +589,101 @@ class GameTrackerApp(QMainWindow):
 
         self.view_guide_text = QTextBrowser()
         self.view_guide_text.setObjectName("viewGuideText")
-        self.view_guide_text.setFont(QFont("Segoe UI", 10))
+        self.view_guide_text.setFont(self.FONT_BODY)
         self.view_guide_text.setOpenExternalLinks(True)
         self.view_guide_text.setMinimumHeight(150)
         self.view_guide_text.setFrameShape(QFrame.Shape.NoFrame)
         self.view_guide_text.setContentsMargins(0, 0, 0, 10)
         layout.addWidget(self.view_guide_text, stretch=1)  # Add stretch to expand with window
+        # Markdown source last rendered into view_guide_text
+        self._view_guide_source = None
 
         self.edit_button = QPushButton("✏️ Edit")
-        self.edit_button.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        self.edit_button.setFont(self.FONT_LABEL)
         self.edit_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.edit_button.setMinimumHeight(40)
         self.edit_button.clicked.connect(self._enter_edit_mode)
         layout.addWidget(self.edit_button)
 
+        self._view_widgets = (
+            self.view_status_label,
+            self.view_status_text,
+            self.view_situation_label,
+            self.view_situation_text,
+            self.view_objective_label,
+            self.view_objective_text,
+            self.view_guide_label,
+            self.view_guide_text,
+            self.edit_button,
+        )
+
+        # Edit mode widgets are built on first use by _build_edit_widgets()
+        self._edit_layout = QVBoxLayout()
+        self._edit_layout.setContentsMargins(0, 0, 0, 0)
+        self._edit_layout.setSpacing(15)
+        layout.addLayout(self._edit_layout, stretch=1)
+        self._edit_built = False
+        layout.addStretch(1)
+
+        self._set_details_enabled(False)
+
+        content_widget.setLayout(layout)
+        scroll_area.setWidget(content_widget)
+
+        panel_layout = QVBoxLayout()
+        panel_layout.setContentsMargins(0, 0, 0, 0)
+        panel_layout.addWidget(scroll_area)
+        panel.setLayout(panel_layout)
+
+        return panel
+
+    def _build_edit_widgets(self):
+        """Create the edit mode widgets the first time edit mode is entered"""
+        if self._edit_built:
+            return
+
+        layout = self._edit_layout
+
         # Edit mode: Status as dropdown
         self.edit_status_label = QLabel("🎮 Game Status:")
-        self.edit_status_label.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        self.edit_status_label.setFont(self.FONT_LABEL)
         self.edit_status_label.setWordWrap(True)
         layout.addWidget(self.edit_status_label)
 
         self.status_combo = QComboBox()
         self.status_combo.addItems(["In Progress", "Completed"])
-        self.status_combo.setFont(QFont("Segoe UI", 10))
+        self.status_combo.setFont(self.FONT_BODY)
         self.status_combo.currentIndexChanged.connect(self._on_status_changed)
         layout.addWidget(self.status_combo)
 
         self.edit_situation_label = QLabel("📝 Current Situation / What I Last Did:")
-        self.edit_situation_label.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        self.edit_situation_label.setFont(self.FONT_LABEL)
         self.edit_situation_label.setWordWrap(True)
         layout.addWidget(self.edit_situation_label)
 
-        self.situation_input = QTextEdit()
+        self.situation_input = QPlainTextEdit()
         self.situation_input.setPlaceholderText("Describe where you are in the game and what you last remember doing...")
-        self.situation_input.setFont(QFont("Segoe UI", 10))
+        self.situation_input.setFont(self.FONT_BODY)
         self.situation_input.setMinimumHeight(80)
         self.situation_input.setMaximumHeight(120)
-        self.situation_input.textChanged.connect(self._on_text_changed)
+        self.situation_input.textChanged.connect(self._on_situation_changed)
         layout.addWidget(self.situation_input)
 
         self.edit_objective_label = QLabel("🎯 Next Objective (Optional):")
-        self.edit_objective_label.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        self.edit_objective_label.setFont(self.FONT_LABEL)
         self.edit_objective_label.setWordWrap(True)
         layout.addWidget(self.edit_objective_label)
 
-        self.objective_input = QTextEdit()
+        self.objective_input = QPlainTextEdit()
         self.objective_input.setPlaceholderText("What do you want to accomplish next? (Optional)")
-        self.objective_input.setFont(QFont("Segoe UI", 10))
+        self.objective_input.setFont(self.FONT_BODY)
         self.objective_input.setMinimumHeight(60)
         self.objective_input.setMaximumHeight(80)
-        self.objective_input.textChanged.connect(self._on_text_changed)
+        self.objective_input.textChanged.connect(self._on_objective_changed)
         layout.addWidget(self.objective_input)
 
         self.edit_behavior_label = QLabel("⚙️ Output Style:")
-        self.edit_behavior_label.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        self.edit_behavior_label.setFont(self.FONT_LABEL)
         self.edit_behavior_label.setWordWrap(True)
         layout.addWidget(self.edit_behavior_label)
 
@@ -408,13 +695,13 @@ class GameTrackerApp(QMainWindow):
             "Tips & Tricks Style",
             "Custom Instructions"
         ])
-        self.behavior_combo.setFont(QFont("Segoe UI", 10))
+        self.behavior_combo.setFont(self.FONT_BODY)
         self.behavior_combo.currentIndexChanged.connect(self._on_behavior_style_changed)
         layout.addWidget(self.behavior_combo)
 
-        self.custom_behavior_input = QTextEdit()
+        self.custom_behavior_input = QPlainTextEdit()
         self.custom_behavior_input.setPlaceholderText("Enter custom instructions for how the guide should respond...")
-        self.custom_behavior_input.setFont(QFont("Segoe UI", 10))
+        self.custom_behavior_input.setFont(self.FONT_BODY)
         self.custom_behavior_input.setMinimumHeight(60)
         self.custom_behavior_input.setMaximumHeight(80)
         self.custom_behavior_input.textChanged.connect(self._on_custom_behavior_changed)
@@ -422,7 +709,7 @@ class GameTrackerApp(QMainWindow):
         layout.addWidget(self.custom_behavior_input)
 
         self.guide_button = QPushButton("🔍 See Next Step")
-        self.guide_button.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        self.guide_button.setFont(self.FONT_LABEL)
         self.guide_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.guide_button.setMinimumHeight(40)
         self.guide_button.clicked.connect(self._generate_guide)
@@ -435,14 +722,16 @@ class GameTrackerApp(QMainWindow):
         status_layout.setSpacing(6)
 
         status_title = QLabel("Processing Status")
-        status_title.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+        status_title.setFont(self.FONT_BODY_BOLD)
         status_layout.addWidget(status_title)
 
         self.status_display = QPlainTextEdit()
         self.status_display.setObjectName("statusDisplay")
         self.status_display.setReadOnly(True)
-        self.status_display.setFont(QFont("Segoe UI", 9))
+        self.status_display.setFont(self.FONT_SMALL)
         self.status_display.setFixedHeight(120)
+        # Let the document evict old lines itself as new ones are appended
+        self.status_display.setMaximumBlockCount(STATUS_LOG_MAX_LINES)
         self.status_display.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         self.status_display.setCursor(Qt.CursorShape.ArrowCursor)
         status_layout.addWidget(self.status_display)
@@ -452,31 +741,22 @@ class GameTrackerApp(QMainWindow):
         layout.addWidget(self.status_panel)
 
         self.edit_guide_output_label = QLabel("💡 Guide Hint:")
-        self.edit_guide_output_label.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        self.edit_guide_output_label.setFont(self.FONT_LABEL)
         self.edit_guide_output_label.setWordWrap(True)
         layout.addWidget(self.edit_guide_output_label)
 
-        # Edit mode: QTextEdit for editing raw markdown
-        self.guide_output_edit = QTextEdit()
-        self.guide_output_edit.setFont(QFont("Segoe UI", 10))
+        # Edit mode: plain text editor for the raw markdown
+        self.guide_output_edit = QPlainTextEdit()
+        self.guide_output_edit.setFont(self.FONT_BODY)
         self.guide_output_edit.setPlaceholderText("Your guide hint will appear here after clicking 'See Next Step'...")
         self.guide_output_edit.setMinimumHeight(120)
         self.guide_output_edit.textChanged.connect(self._on_guide_output_changed)
         layout.addWidget(self.guide_output_edit, stretch=1)
 
-        # View mode: QTextBrowser for rendering markdown (hidden in edit mode)
-        self.guide_output_view = QTextBrowser()
-        self.guide_output_view.setObjectName("guideOutputView")
-        self.guide_output_view.setFont(QFont("Segoe UI", 10))
-        self.guide_output_view.setOpenExternalLinks(True)
-        self.guide_output_view.setMinimumHeight(120)
-        self.guide_output_view.setVisible(False)
-        layout.addWidget(self.guide_output_view, stretch=1)
-
         button_row = QHBoxLayout()
 
         self.done_button = QPushButton("✓ Done")
-        self.done_button.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+        self.done_button.setFont(self.FONT_BODY_BOLD)
         self.done_button.setMinimumHeight(35)
         self.done_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.done_button.clicked.connect(self._exit_edit_mode)
@@ -485,7 +765,7 @@ class GameTrackerApp(QMainWindow):
         button_row.addStretch()
 
         self.delete_button = QPushButton("🗑️ Delete Game")
-        self.delete_button.setFont(QFont("Segoe UI", 10))
+        self.delete_button.setFont(self.FONT_BODY)
         self.delete_button.setMinimumHeight(35)
         self.delete_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.delete_button.clicked.connect(self._delete_current_game)
@@ -493,25 +773,48 @@ class GameTrackerApp(QMainWindow):
         button_row.addWidget(self.delete_button)
 
         layout.addLayout(button_row)
-        layout.addStretch(1)
-
-        self._set_details_enabled(False)
-
-        content_widget.setLayout(layout)
-        scroll_area.setWidget(content_widget)
 
-        panel_layout = QVBoxLayout()
-        panel_layout.setContentsMargins(0, 0, 0, 0)
-        panel_layout.addWidget(scroll_area)
-        panel.setLayout(panel_layout)
+        # Custom instructions visibility follows the selected output style
+        self._edit_widgets = (
+            self.edit_status_label,
+            self.status_combo,
+            self.edit_situation_label,
+            self.situation_input,
+            self.edit_objective_label,
+            self.objective_input,
+            self.edit_behavior_label,
+            self.behavior_combo,
+            self.guide_button,
+            self.edit_guide_output_label,
+            self.guide_output_edit,
+            self.done_button,
+            self.delete_button,
+        )
 
-        return panel
+        self._edit_built = True
+        if self.current_game:
+            self._load_edit_fields(self.games.get(self.current_game, {}))
 
     # ------------------------------------------------------------------
     # Data helpers
     # ------------------------------------------------------------------
+    def _prepare_title_dialog(self, window_title, ok_text, initial=""):
+        """Return the shared title dialog set up for an add or a rename"""
+        if self._title_dialog is None:
+            self._title_dialog = AddGameDialog(self)
+        dialog = self._title_dialog
+        dialog.setWindowTitle(window_title)
+        dialog.set_primary_button_text(ok_text)
+        dialog.set_title(initial)
+        dialog.title_input.setFocus()
+        return dialog
+
+    @pyqtSlot()
     def _add_new_game(self):
-        dialog = AddGameDialog(self)
+        if not self._library_loaded:
+            return
+
+        dialog = self._prepare_title_dialog("Add New Game", "Add Game")
         if dialog.exec() != QDialog.DialogCode.Accepted:
             return
 
@@ -532,24 +835,20 @@ class GameTrackerApp(QMainWindow):
             "guide": "",
             "status": "In Progress"  # New games default to "In Progress"
         }
-        self.data_manager.save_games(self.games)
-        self._populate_game_list()
+        self._flush_save()
 
-        items = self.game_list.findItems(title, Qt.MatchFlag.MatchExactly)
-        if items:
-            self.game_list.setCurrentItem(items[0])
-            self._on_game_selected(items[0])
+        # Insert just the new row instead of rebuilding the whole list
+        row = self._insertion_row(self._index_title(title))
+        self.game_model.insert_title(row, title)
+        self._select_row(row)
 
-    def _rename_game(self, item):
-        if not item:
+    @pyqtSlot(QModelIndex)
+    def _rename_game(self, index):
+        if not index.isValid():
             return
 
-        old_title = item.text()
-        dialog = AddGameDialog(self)
-        dialog.setWindowTitle("Rename Game")
-        dialog.set_primary_button_text("Rename")
-        dialog.title_input.setText(old_title)
-        dialog.title_input.selectAll()
+        old_title = self.game_model.title_at(index.row())
+        dialog = self._prepare_title_dialog("Rename Game", "Rename", old_title)
 
         if dialog.exec() != QDialog.DialogCode.Accepted:
             return
@@ -566,30 +865,40 @@ class GameTrackerApp(QMainWindow):
             QMessageBox.warning(self, "Game Exists", f"'{new_title}' is already in your library!")
             return
 
+        old_row = index.row()
         self.games[new_title] = self.games.pop(old_title)
         if self.current_game == old_title:
             self.current_game = new_title
 
-        self.data_manager.save_games(self.games)
-        self._populate_game_list()
+        # Coalesce with other pending edits; closing the app flushes it
+        self._save_timer.start()
 
-        items = self.game_list.findItems(new_title, Qt.MatchFlag.MatchExactly)
-        if items:
-            self.game_list.setCurrentItem(items[0])
-            self._on_game_selected(items[0])
+        # Update just the renamed row instead of rebuilding the whole list
+        self._unindex_title(old_title)
+        position = self._index_title(new_title)
+        new_row = self._insertion_row(position, self.game_model.rowCount() - 1)
+        if new_row == old_row:
+            self.game_model.rename_row(old_row, new_title)
+        else:
+            self.game_model.remove_row(old_row)
+            self.game_model.insert_title(new_row, new_title)
+        self._select_row(new_row)
 
     # ------------------------------------------------------------------
     # Game selection and display
     # ------------------------------------------------------------------
-    def _on_game_selected(self, item):
-        if not item:
+    def _select_row(self, row):
+        """Select the library row and show that game's details"""
+        index = self.game_model.index(row)
+        self.game_list.setCurrentIndex(index)
+        self._on_game_selected(index)
+
+    @pyqtSlot(QModelIndex)
+    def _on_game_selected(self, index):
+        if not index.isValid():
             return
 
-        # Remove status emoji if present
-        title = item.text()
-        if title.startswith("✅ "):
-            title = title[2:]
-        
+        title = self.game_model.title_at(index.row())
         self.current_game = title
         self.is_edit_mode = False
         self._load_game_details(title)
@@ -598,60 +907,66 @@ class GameTrackerApp(QMainWindow):
     def _load_game_details(self, title):
         data = self.games.get(title, {})
         self.game_title_label.setText(title)
+        self.view_status_text.setText(data.get("status", "In Progress"))
 
-        self.situation_input.blockSignals(True)
-        self.objective_input.blockSignals(True)
-        self.status_combo.blockSignals(True)
-        self.behavior_combo.blockSignals(True)
-        self.custom_behavior_input.blockSignals(True)
-        self.guide_output_edit.blockSignals(True)
+        if self._edit_built:
+            self._load_edit_fields(data)
 
-        self.situation_input.setPlainText(data.get("situation", ""))
-        self.objective_input.setPlainText(data.get("objective", ""))
-        
-        # Load status (with backward compatibility)
-        status = data.get("status", "In Progress")
-        self.view_status_text.setText(status)  # Set view mode label
-        status_index = self.status_combo.findText(status)
-        if status_index >= 0:
-            self.status_combo.setCurrentIndex(status_index)
-        else:
-            self.status_combo.setCurrentIndex(0)
-        
-        # Load behavior style (with backward compatibility)
-        behavior_style = data.get("behavior_style", "Walkthrough Style (Next Step)")
-        custom_behavior = data.get("custom_behavior", "")
-        
-        # Backward compatibility: if old "behavior" field exists, use it as custom
-        if "behavior" in data and data["behavior"] and not behavior_style:
-            behavior_style = "Custom Instructions"
-            custom_behavior = data["behavior"]
-        
-        index = self.behavior_combo.findText(behavior_style)
-        if index >= 0:
-            self.behavior_combo.setCurrentIndex(index)
-        else:
-            self.behavior_combo.setCurrentIndex(0)
-        
-        self.custom_behavior_input.setPlainText(custom_behavior)
-        self._update_custom_behavior_visibility()
-        
-        self._set_guide_output_text(data.get("guide", ""))
+        self._update_view_mode()
 
-        self.situation_input.blockSignals(False)
-        self.objective_input.blockSignals(False)
-        self.status_combo.blockSignals(False)
-        self.behavior_combo.blockSignals(False)
-        self.custom_behavior_input.blockSignals(False)
-        self.guide_output_edit.blockSignals(False)
+    def _load_edit_fields(self, data):
+        """Fill the edit mode widgets from a game's saved data"""
+        with _signals_blocked(self.status_combo, self.behavior_combo, self.guide_output_edit):
+            # Load status (with backward compatibility)
+            status = data.get("status", "In Progress")
+            status_index = self.status_combo.findText(status)
+            self.status_combo.setCurrentIndex(max(status_index, 0))
 
-        self._update_view_mode()
+            # Load behavior style (with backward compatibility)
+            behavior_style = data.get("behavior_style", "Walkthrough Style (Next Step)")
+            custom_behavior = data.get("custom_behavior", "")
+
+            # Backward compatibility: if old "behavior" field exists, use it as custom
+            if "behavior" in data and data["behavior"] and not behavior_style:
+                behavior_style = "Custom Instructions"
+                custom_behavior = data["behavior"]
+
+            index = self.behavior_combo.findText(behavior_style)
+            self.behavior_combo.setCurrentIndex(max(index, 0))
+
+            self._set_inputs_silent(
+                data.get("situation", ""), data.get("objective", ""), custom_behavior
+            )
+            self._update_custom_behavior_visibility()
+
+            self._set_guide_output_text(data.get("guide", ""))
+
+    def _set_inputs_silent(self, situation, objective, custom_behavior):
+        """Fill the game text inputs without triggering their autosave handlers"""
+        inputs = (
+            (self.situation_input, situation),
+            (self.objective_input, objective),
+            (self.custom_behavior_input, custom_behavior),
+        )
+        with _signals_blocked(self.situation_input, self.objective_input, self.custom_behavior_input):
+            for widget, text in inputs:
+                # Skip the document relayout and undo history reset when unchanged
+                if widget.toPlainText() != text:
+                    widget.setPlainText(text)
 
+    @pyqtSlot()
     def _enter_edit_mode(self):
-        self.is_edit_mode = True
-        self._update_view_mode()
+        # Building the editors the first time adds a dozen widgets to a visible
+        # panel; lay them out and paint them together with the mode switch
+        with _updates_paused(self._details_content):
+            self._build_edit_widgets()
+            self.is_edit_mode = True
+            self._update_view_mode()
 
+    @pyqtSlot()
     def _exit_edit_mode(self):
+        # Leaving the editor is a natural save point; don't wait out the debounce
+        self.flush_state()
         self.is_edit_mode = False
         self._update_view_mode()
 
@@ -664,149 +979,161 @@ class GameTrackerApp(QMainWindow):
         objective = game_data.get("objective", "")
         guide = game_data.get("guide", "")
 
-        if self.is_edit_mode:
-            self._set_view_elements_visible(False)
-            self._set_edit_elements_visible(True)
-            self.status_panel.setVisible(bool(self._status_messages))
-        else:
-            self._set_edit_elements_visible(False)
-            self.status_panel.setVisible(False)
-            self.view_situation_text.setText(situation)
-            self.view_objective_text.setText(objective)
-            
-            # Render guide as markdown HTML
-            if guide:
-                guide_html = markdown.markdown(
-                    guide,
-                    extensions=['extra', 'nl2br', 'sane_lists']
-                )
-                self.view_guide_text.setHtml(guide_html)
+        # Lay out and repaint the panel once for the whole batch of changes
+        with _updates_paused(self._details_content):
+            if self.is_edit_mode:
+                self._set_view_elements_visible(False)
+                self._set_edit_elements_visible(True)
+                self.status_panel.setVisible(bool(self._status_messages))
             else:
-                self.view_guide_text.clear()
-
-            # Status should always be visible in view mode
-            self.view_status_label.setVisible(True)
-            self.view_status_text.setVisible(True)
-            
-            self.view_situation_label.setVisible(bool(situation))
-            self.view_situation_text.setVisible(bool(situation))
-            self.view_objective_label.setVisible(bool(objective))
-            self.view_objective_text.setVisible(bool(objective))
-            self.view_guide_label.setVisible(bool(guide))
-            self.view_guide_text.setVisible(bool(guide))
-            self.edit_button.setVisible(True)
+                self._set_edit_elements_visible(False)
+                # Skip relayout and word-wrap passes for labels that already match
+                if self.view_situation_text.text() != situation:
+                    self.view_situation_text.setText(situation)
+                if self.view_objective_text.text() != objective:
+                    self.view_objective_text.setText(objective)
+
+                # Render guide as markdown HTML only when the source changed
+                if guide != self._view_guide_source:
+                    if guide:
+                        guide_html = markdown.markdown(
+                            guide,
+                            extensions=['extra', 'nl2br', 'sane_lists']
+                        )
+                        self.view_guide_text.setHtml(guide_html)
+                    else:
+                        self.view_guide_text.clear()
+                    self._view_guide_source = guide
+
+                # Status should always be visible in view mode
+                self.view_status_label.setVisible(True)
+                self.view_status_text.setVisible(True)
+
+                self.view_situation_label.setVisible(bool(situation))
+                self.view_situation_text.setVisible(bool(situation))
+                self.view_objective_label.setVisible(bool(objective))
+                self.view_objective_text.setVisible(bool(objective))
+                self.view_guide_label.setVisible(bool(guide))
+                self.view_guide_text.setVisible(bool(guide))
+                self.edit_button.setVisible(True)
 
     def _set_view_elements_visible(self, visible):
-        self.view_status_label.setVisible(visible)
-        self.view_status_text.setVisible(visible)
-        self.view_situation_label.setVisible(visible)
-        self.view_situation_text.setVisible(visible)
-        self.view_objective_label.setVisible(visible)
-        self.view_objective_text.setVisible(visible)
-        self.view_guide_label.setVisible(visible)
-        self.view_guide_text.setVisible(visible)
-        self.edit_button.setVisible(visible)
+        for widget in self._view_widgets:
+            widget.setVisible(visible)
 
     def _set_edit_elements_visible(self, visible):
-        self.edit_status_label.setVisible(visible)
-        self.status_combo.setVisible(visible)
-        self.edit_situation_label.setVisible(visible)
-        self.situation_input.setVisible(visible)
-        self.edit_objective_label.setVisible(visible)
-        self.objective_input.setVisible(visible)
-        self.edit_behavior_label.setVisible(visible)
-        self.behavior_combo.setVisible(visible)
+        if not self._edit_built:
+            return
+        if not visible:
+            self.status_panel.setVisible(False)
+        for widget in self._edit_widgets:
+            widget.setVisible(visible)
         # Custom behavior visibility is handled by _update_custom_behavior_visibility
         if visible:
             self._update_custom_behavior_visibility()
         else:
             self.custom_behavior_input.setVisible(False)
-        self.guide_button.setVisible(visible)
-        self.edit_guide_output_label.setVisible(visible)
-        # In edit mode: show editable text, hide rendered view
-        self.guide_output_edit.setVisible(visible)
-        self.guide_output_view.setVisible(False)
-        self.done_button.setVisible(visible)
-        self.delete_button.setVisible(visible)
 
     def _set_details_enabled(self, enabled):
-        self._hide_status_panel()
-        self.game_title_label.setVisible(enabled)
-        self.divider.setVisible(enabled)
-
-        if not enabled:
-            self._set_view_elements_visible(False)
-            self._set_edit_elements_visible(False)
-            self.game_title_label.setText("")
-            self.situation_input.clear()
-            self.objective_input.clear()
-            self.behavior_combo.setCurrentIndex(0)
-            self.custom_behavior_input.clear()
-            self._set_guide_output_text("")
-            self.is_edit_mode = False
-        else:
-            self.is_edit_mode = False
-            self._update_view_mode()
+        with _updates_paused(self._details_content):
+            self._hide_status_panel()
+            self.game_title_label.setVisible(enabled)
+            self.divider.setVisible(enabled)
+
+            if not enabled:
+                self._set_view_elements_visible(False)
+                self._set_edit_elements_visible(False)
+                self.game_title_label.setText("")
+                if self._edit_built:
+                    self.situation_input.clear()
+                    self.objective_input.clear()
+                    self.behavior_combo.setCurrentIndex(0)
+                    self.custom_behavior_input.clear()
+                    self._set_guide_output_text("")
+                self.is_edit_mode = False
+            else:
+                self.is_edit_mode = False
+                self._update_view_mode()
+
+    def _current_game_data(self):
+        """Return the selected game's record, or None when nothing is selected"""
+        if not self.current_game:
+            return None
+        return self.games.get(self.current_game)
 
     def _set_guide_output_text(self, text):
-        """Update guide output - raw markdown in edit mode, rendered HTML in view mode."""
-        # Set raw markdown in edit mode widget
-        self.guide_output_edit.setPlainText(text)
-        
-        # Convert markdown to HTML for view mode widget
-        html_content = markdown.markdown(
-            text,
-            extensions=['extra', 'nl2br', 'sane_lists']
-        )
-        self.guide_output_view.setHtml(html_content)
-        
+        """Update the raw markdown guide editor; view mode renders it on demand."""
+        if self.guide_output_edit.toPlainText() != text:
+            self.guide_output_edit.setPlainText(text)
+
         # Store the raw markdown text for data persistence
-        if self.current_game and self.current_game in self.games:
-            self.games[self.current_game]["guide"] = text
-            self.data_manager.save_games(self.games)
+        game_data = self._current_game_data()
+        if game_data is not None and game_data.get("guide") != text:
+            game_data["guide"] = text
+            self._save_timer.start()
 
+    @pyqtSlot()
     def _on_guide_output_changed(self):
         """Save changes when user edits the raw markdown in edit mode."""
-        if not self.current_game or self.current_game not in self.games:
+        game_data = self._current_game_data()
+        if game_data is None:
             return
         
         text = self.guide_output_edit.toPlainText()
-        self.games[self.current_game]["guide"] = text
-        self.data_manager.save_games(self.games)
+        # setPlainText from _set_guide_output_text lands here with the stored text
+        if game_data.get("guide") == text:
+            return
+        game_data["guide"] = text
+        self._save_timer.start()
 
-    def _on_text_changed(self):
-        if not self.current_game or self.current_game not in self.games:
+    @pyqtSlot()
+    def _on_situation_changed(self):
+        game_data = self._current_game_data()
+        if game_data is None:
             return
 
-        self.games[self.current_game]["situation"] = self.situation_input.toPlainText()
-        self.games[self.current_game]["objective"] = self.objective_input.toPlainText()
-        self.data_manager.save_games(self.games)
+        game_data["situation"] = self.situation_input.toPlainText()
+        self._save_timer.start()
+
+    @pyqtSlot()
+    def _on_objective_changed(self):
+        game_data = self._current_game_data()
+        if game_data is None:
+            return
 
+        game_data["objective"] = self.objective_input.toPlainText()
+        self._save_timer.start()
+
+    @pyqtSlot(int)
     def _on_behavior_style_changed(self, index):
-        if not self.current_game or self.current_game not in self.games:
+        game_data = self._current_game_data()
+        if game_data is None:
             return
         
-        behavior_style = self.behavior_combo.currentText()
-        self.games[self.current_game]["behavior_style"] = behavior_style
-        self.data_manager.save_games(self.games)
+        game_data["behavior_style"] = self.behavior_combo.currentText()
+        self._save_timer.start()
         self._update_custom_behavior_visibility()
 
+    @pyqtSlot()
     def _on_custom_behavior_changed(self):
-        if not self.current_game or self.current_game not in self.games:
+        game_data = self._current_game_data()
+        if game_data is None:
             return
         
-        self.games[self.current_game]["custom_behavior"] = self.custom_behavior_input.toPlainText()
-        self.data_manager.save_games(self.games)
+        game_data["custom_behavior"] = self.custom_behavior_input.toPlainText()
+        self._save_timer.start()
 
+    @pyqtSlot(int)
     def _on_status_changed(self, index):
-        if not self.current_game or self.current_game not in self.games:
+        game_data = self._current_game_data()
+        if game_data is None:
             return
         
         status = self.status_combo.currentText()
-        self.games[self.current_game]["status"] = status
+        game_data["status"] = status
         self.view_status_text.setText(status)  # Update view mode label
-        self.data_manager.save_games(self.games)
-        self._populate_game_list()
+        self._save_timer.start()
+        self.game_model.refresh_title(self.current_game)
 
     def _update_custom_behavior_visibility(self):
         """Show/hide custom behavior input based on selected style"""
@@ -816,6 +1143,7 @@ class GameTrackerApp(QMainWindow):
     # ------------------------------------------------------------------
     # AI guidance workflow
     # ------------------------------------------------------------------
+    @pyqtSlot()
     def _generate_guide(self):
         if not self.current_game:
             return
@@ -825,8 +1153,15 @@ class GameTrackerApp(QMainWindow):
             QMessageBox.warning(self, "Missing Information", "Please fill in the 'Current Situation' field first!")
             return
 
+        if self._api_save_timer.isActive():
+            self._flush_api_key()
+        if self._save_timer.isActive():
+            self._flush_save()
+
+        # A click can beat the deferred load of the stored key
+        self._load_api_settings()
         provider = self.settings.get("ai_provider", "Gemini")
-        api_key = self.data_manager.load_api_key(provider)
+        api_key = self._api_key_plain
 
         if not api_key:
             QMessageBox.warning(self, "API Key Missing", "Please enter your API key in the top bar!")
@@ -852,7 +1187,11 @@ class GameTrackerApp(QMainWindow):
             "provider": provider,
         }
 
-        self.current_worker_thread = QThread()
+        # Repeating the exact same request means the previous answer was not good enough
+        guide_request = (params["game_title"], params["situation"], params["objective"], params["behavior"], provider)
+        use_cache = guide_request != self._last_guide_request
+        self._last_guide_request = guide_request
+
         self.current_worker = GuideGenerationWorker(
             params["game_title"],
             params["situation"],
@@ -861,17 +1200,13 @@ class GameTrackerApp(QMainWindow):
             params["api_key"],
             params["provider"],
             self.ai_manager,
+            use_cache=use_cache,
         )
 
-        self.current_worker.moveToThread(self.current_worker_thread)
-        self.current_worker_thread.started.connect(self.current_worker.run)
-        self.current_worker.status_update.connect(self._on_status_update)
-        self.current_worker.finished.connect(self._on_worker_finished)
-        self.current_worker.finished.connect(self.current_worker_thread.quit)
-        self.current_worker.finished.connect(self.current_worker.deleteLater)
-        self.current_worker_thread.finished.connect(self.current_worker_thread.deleteLater)
+        self.current_worker.signals.status_update.connect(self._on_status_update)
+        self.current_worker.signals.finished.connect(self._on_worker_finished)
 
-        self.current_worker_thread.start()
+        self.thread_pool.start(self.current_worker)
 
     def _get_behavior_instruction(self, behavior_style):
         """Convert behavior style selection into AI instruction"""
@@ -925,7 +1260,11 @@ Focus on giving them an EDGE, not basic walkthrough advice. Search for speedrun
         else:
             return ""
 
+    @pyqtSlot(dict)
     def _on_worker_finished(self, result):
+        # Abandoned model samples may still report in; keep them out of later logs
+        self.current_worker.signals.status_update.disconnect(self._on_status_update)
+        self.current_worker = None
         self._reset_guide_button()
 
         if result.get("error"):
@@ -957,25 +1296,47 @@ Focus on giving them an EDGE, not basic walkthrough advice. Search for speedrun
 
         if self.current_game:
             self.games[self.current_game]["guide"] = display_text
-            self.data_manager.save_games(self.games)
+            self._flush_save()
 
         if not self.is_edit_mode:
             self._update_view_mode()
 
         self._hide_status_panel()
 
+    @pyqtSlot(str)
     def _on_status_update(self, message):
-        if not message:
+        # Drop messages queued by a worker that has already finished
+        if not message or self.current_worker is None or self.sender() is not self.current_worker.signals:
             return
         self._status_messages.append(message)
-        self._show_status_panel()
+        self._pending_status.append(message)
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    @pyqtSlot()
+    def _flush_status(self):
+        """Append status lines received since the last flush"""
+        if not self._pending_status:
+            return
+        if not self.status_panel.isVisible():
+            self.status_panel.setVisible(True)
+        self.status_display.appendPlainText("\n".join(self._pending_status))
+        self._pending_status = []
+        self._scroll_status_to_end()
+
+    def _scroll_status_to_end(self):
+        scrollbar = self.status_display.verticalScrollBar()
+        if scrollbar:
+            scrollbar.setValue(scrollbar.maximum())
 
     def _reset_guide_button(self):
         self.guide_button.setEnabled(True)
         self.guide_button.setText("🔍 See Next Step")
 
     def _clear_status_log(self):
-        self._status_messages = []
+        self._status_messages.clear()
+        self._pending_status = []
+        self._status_timer.stop()
         self.status_display.clear()
 
     def _show_status_panel(self):
@@ -985,14 +1346,16 @@ Focus on giving them an EDGE, not basic walkthrough advice. Search for speedrun
             self.status_display.clear()
             return
         self.status_display.setPlainText("\n".join(self._status_messages))
-        scrollbar = self.status_display.verticalScrollBar()
-        if scrollbar:
-            scrollbar.setValue(scrollbar.maximum())
+        self._scroll_status_to_end()
 
     def _hide_status_panel(self):
+        self._status_messages.clear()
+        self._pending_status = []
+        self._status_timer.stop()
+        if not self._edit_built:
+            return
         self.status_panel.setVisible(False)
         self.status_display.clear()
-        self._status_messages = []
 
     # ------------------------------------------------------------------
     # Guide formatting (matching original behaviour)
@@ -1001,8 +1364,8 @@ Focus on giving them an EDGE, not basic walkthrough advice. Search for speedrun
         if not guides:
             return "No guide suggestions available."
 
+        # Keyed by normalized text; dict order keeps the first-seen order of hints
         aggregation = {}
-        order = []
         total = 0
 
         for idx, guide in enumerate(guides, start=1):
@@ -1011,18 +1374,14 @@ Focus on giving them an EDGE, not basic walkthrough advice. Search for speedrun
                 continue
 
             normalized = " ".join(text.lower().split())
-            if normalized not in aggregation:
-                aggregation[normalized] = {"text": text, "sources": set(), "count": 0, "indices": []}
-                order.append(normalized)
+            entry = aggregation.get(normalized)
+            if entry is None:
+                entry = aggregation[normalized] = {"text": text, "sources": set(), "count": 0, "indices": []}
 
-            entry = aggregation[normalized]
             entry["count"] += 1
             entry["indices"].append(idx)
             total += 1
-
-            for src in guide.get("sources", []):
-                if src:
-                    entry["sources"].add(src)
+            entry["sources"].update(src for src in guide.get("sources", []) if src)
 
         recommended_original_index = 0
         evaluation_confidence = ""
@@ -1035,7 +1394,9 @@ Focus on giving them an EDGE, not basic walkthrough advice. Search for speedrun
                 recommended_original_index = 0
 
             confidence_value = evaluation.get("confidence")
-            if confidence_value not in (None, ""):
+            if isinstance(confidence_value, int) and not isinstance(confidence_value, bool):
+                evaluation_confidence = f"{confidence_value}%"
+            elif confidence_value not in (None, ""):
                 try:
                     evaluation_confidence = f"{float(confidence_value):.0f}%"
                 except (ValueError, TypeError):
@@ -1046,10 +1407,11 @@ Focus on giving them an EDGE, not basic walkthrough advice. Search for speedrun
         aggregated_guides = []
         recommended_agg_index = 0
 
-        for display_idx, key in enumerate(order, start=1):
-            data = aggregation[key]
-            trust_value = 100.0 if total == 0 else (data["count"] / total) * 100.0
-            trust_display = f"{trust_value:.1f}%" if trust_value % 1 else f"{int(trust_value)}%"
+        for display_idx, data in enumerate(aggregation.values(), start=1):
+            # Trust in tenths of a percent, rounded half up, kept in integers
+            trust_tenths = 1000 if total == 0 else (data["count"] * 2000 + total) // (2 * total)
+            whole, tenth = divmod(trust_tenths, 10)
+            trust_display = f"{whole}.{tenth}%" if tenth else f"{whole}%"
 
             if recommended_original_index and recommended_original_index in data["indices"]:
                 recommended_agg_index = display_idx
@@ -1073,9 +1435,7 @@ Focus on giving them an EDGE, not basic walkthrough advice. Search for speedrun
 
         context_block = (refined_context or "").strip()
         if context_block:
-            lines.append("")
-            lines.append("Context Clarification")
-            lines.append(context_block)
+            lines.extend(("", "Context Clarification", context_block))
         lines.append("")
 
         if aggregated_guides and len(aggregated_guides) > 1 and recommended_agg_index:
@@ -1085,19 +1445,20 @@ Focus on giving them an EDGE, not basic walkthrough advice. Search for speedrun
                 lines.append(f"Why: {evaluation_reasoning}")
             lines.append("")
 
+        # Only one entry can be the recommended one; zero means none was chosen
+        recommended_trust = evaluation_confidence if recommended_agg_index else ""
         for entry in aggregated_guides:
-            is_recommended = entry["display_index"] == recommended_agg_index and recommended_agg_index > 0
+            display_index = entry["display_index"]
+            is_recommended = display_index == recommended_agg_index
             marker = "★" if is_recommended else " "
-            trust_value_display = entry["trust"]
-            if is_recommended and evaluation_confidence:
-                trust_value_display = evaluation_confidence
+            trust_value_display = (is_recommended and recommended_trust) or entry["trust"]
             trust_suffix = f" [Trust Score: {trust_value_display}]" if trust_value_display else ""
-            lines.append(f"{entry['display_index']}. {marker} {entry['text']}{trust_suffix}")
+            lines.append(f"{display_index}. {marker} {entry['text']}{trust_suffix}")
 
-            if entry["sources"]:
+            sources = entry["sources"]
+            if sources:
                 lines.append("   Sources:")
-                for src in entry["sources"]:
-                    lines.append(f"     • {src}")
+                lines.extend(f"     • {src}" for src in sources)
             lines.append("")
 
         return "\n".join(lines).strip()
@@ -1105,6 +1466,7 @@ Focus on giving them an EDGE, not basic walkthrough advice. Search for speedrun
     # ------------------------------------------------------------------
     # Theme & settings persistence
     # ------------------------------------------------------------------
+    @pyqtSlot(int)
     def _on_theme_changed(self, index):
         self.current_theme_index = index
         current_theme = self.themes[index]
@@ -1138,6 +1500,7 @@ Focus on giving them an EDGE, not basic walkthrough advice. Search for speedrun
         self.sort_action_date.setChecked(self.sort_method == "Date Added")
         self.sort_action_alpha.setChecked(self.sort_method == "Alphabetically")
 
+    @pyqtSlot()
     def _toggle_sort_order(self):
         self.sort_ascending = not self.sort_ascending
         
@@ -1161,184 +1524,145 @@ Focus on giving them an EDGE, not basic walkthrough advice. Search for speedrun
 
     def _sort_and_refresh_games(self):
         # Preserve current selection while refreshing the list
-        current_title = self.current_game["title"] if self.current_game else None
+        current_title = self.current_game
         self._populate_game_list()
 
-        if current_title:
-            normalized_current = current_title.strip()
-            for index in range(self.game_list.count()):
-                item_text = self.game_list.item(index).text().replace("✅ ", "").strip()
-                if item_text == normalized_current:
-                    self.game_list.setCurrentRow(index)
-                    break
+        if current_title in self.games:
+            row = self.game_model.row_of(current_title)
+            self.game_list.setCurrentIndex(self.game_model.index(row))
 
-    def _populate_game_list(self):
-        self.game_list.clear()
-        
-        # Get list of titles based on sort method
+    def _ordered_titles(self):
+        """Return game titles in the order chosen by the sort controls"""
         if self.sort_method == "Alphabetically":
-            titles = sorted(self.games.keys(), key=str.lower, reverse=not self.sort_ascending)
-        else:  # Date Added - maintain insertion order
+            titles = list(self._sorted_titles)
+        else:
+            # Date Added - maintain insertion order
             titles = list(self.games.keys())
-            if not self.sort_ascending:
-                titles.reverse()
-        
-        for title in titles:
-            game_data = self.games[title]
-            status = game_data.get("status", "In Progress")
-            
-            # Add visual indicator for completed games
-            if status == "Completed":
-                display_text = f"✅ {title}"
-            else:
-                display_text = title
-            
-            self.game_list.addItem(QListWidgetItem(display_text))
+        if not self.sort_ascending:
+            titles.reverse()
+        return titles
+
+    def _index_title(self, title):
+        """Add a title to the alphabetical index and return its position"""
+        key = title.lower()
+        # Place it after any equal keys, matching a stable sort
+        position = bisect.bisect_right(self._sorted_keys, key)
+        self._sorted_keys.insert(position, key)
+        self._sorted_titles.insert(position, title)
+        return position
+
+    def _unindex_title(self, title):
+        """Remove a title from the alphabetical index"""
+        position = bisect.bisect_left(self._sorted_keys, title.lower())
+        while self._sorted_titles[position] != title:
+            position += 1
+        del self._sorted_keys[position]
+        del self._sorted_titles[position]
+
+    def _insertion_row(self, position, count=None):
+        """Return the list row for a title just indexed at the given position
+
+        count is the number of other rows in the list, defaulting to all of them.
+        """
+        if count is None:
+            count = self.game_model.rowCount()
+        if self.sort_method != "Alphabetically":
+            # The newest entry is last in insertion order
+            return count if self.sort_ascending else 0
+        return position if self.sort_ascending else count - position
+
+    def _start_library_load(self):
+        """Read the saved library on the thread pool so the window paints first"""
+        self._library_loader = LibraryLoadWorker(self.data_manager)
+        self._library_loader.signals.loaded.connect(self._on_library_loaded)
+        self.thread_pool.start(self._library_loader)
+
+    @pyqtSlot(dict)
+    def _on_library_loaded(self, games):
+        self._library_loader = None
+        # Update in place: the list model holds a reference to this dict
+        self.games.update(games)
+        self._sorted_titles = sorted(self.games, key=str.lower)
+        self._sorted_keys = [title.lower() for title in self._sorted_titles]
+        self._populate_game_list()
+        self._library_loaded = True
+        self.add_button.setEnabled(True)
+
+    def _populate_game_list(self):
+        self.game_model.set_titles(self._ordered_titles())
 
     def _apply_styles(self):
         current_theme = self.themes[self.current_theme_index]
-        
-        if current_theme == "Dark":
-            bg_main = "#1e1e1e"
-            bg_panel = "#252526"
-            bg_input = "#2d2d30"
-            bg_list = "#2d2d30"
-            text_primary = "#e0e0e0"
-            text_secondary = "#ffffff"
-            border_color = "#3e3e42"
-            hover_bg = "#3e3e42"
-            selected_bg = "#094771"
-            selected_text = "#60cdff"
-            scrollbar_bg = "#3e3e42"
-            scrollbar_handle = "#686868"
-            scrollbar_hover = "#9e9e9e"
-            
-        elif current_theme == "Light":
-            bg_main = "#f9f9f9"
-            bg_panel = "#ffffff"
-            bg_input = "#ffffff"
-            bg_list = "#fafafa"
-            text_primary = "#202020"
-            text_secondary = "#202020"
-            border_color = "#e0e0e0"
-            hover_bg = "#f0f0f0"
-            selected_bg = "#e3f2fd"
-            selected_text = "#0078d4"
-            scrollbar_bg = "#f0f0f0"
-            scrollbar_handle = "#c0c0c0"
-            scrollbar_hover = "#a0a0a0"
-            
-        elif current_theme == "Cyberpunk":
-            bg_main = "#0a0e27"
-            bg_panel = "#131629"
-            bg_input = "#1a1f3a"
-            bg_list = "#1a1f3a"
-            text_primary = "#00ffff"
-            text_secondary = "#ff00ff"
-            border_color = "#ff00ff"
-            hover_bg = "#1f2544"
-            selected_bg = "#2d1b69"
-            selected_text = "#00ffff"
-            scrollbar_bg = "#1f2544"
-            scrollbar_handle = "#ff00ff"
-            scrollbar_hover = "#00ffff"
-            
-        elif current_theme == "Retro":
-            bg_main = "#2b2b2b"
-            bg_panel = "#1a1a1a"
-            bg_input = "#0f0f0f"
-            bg_list = "#0f0f0f"
-            text_primary = "#33ff33"
-            text_secondary = "#33ff33"
-            border_color = "#33ff33"
-            hover_bg = "#3a3a3a"
-            selected_bg = "#004400"
-            selected_text = "#66ff66"
-            scrollbar_bg = "#3a3a3a"
-            scrollbar_handle = "#33ff33"
-            scrollbar_hover = "#66ff66"
-            
-        elif current_theme == "Gaming":
-            # Zelda-inspired green theme
-            bg_main = "#1a3a1a"
-            bg_panel = "#2d5a2d"
-            bg_input = "#1e4a1e"
-            bg_list = "#1e4a1e"
-            text_primary = "#f5f5dc"
-            text_secondary = "#ffffff"
-            border_color = "#5c8a5c"
-            hover_bg = "#3d6a3d"
-            selected_bg = "#4d7a4d"
-            selected_text = "#ffeb3b"
-            scrollbar_bg = "#3d6a3d"
-            scrollbar_handle = "#5c8a5c"
-            scrollbar_hover = "#7caa7c"
-
-        self.setStyleSheet(
-            f"""
-            QMainWindow {{ background-color: {bg_main}; }}
-            QWidget {{ background-color: {bg_main}; color: {text_primary}; }}
-            QFrame {{ background-color: {bg_panel}; border: 1px solid {border_color}; }}
-            QFrame#statusPanel {{ border: 1px dashed {border_color}; background-color: {bg_panel}; }}
-            QLabel {{ color: {text_primary}; background-color: transparent; border: none; }}
-            QListWidget {{ background-color: {bg_list}; border: 1px solid {border_color}; border-radius: 6px; padding: 5px; outline: none; color: {text_primary}; }}
-            QListWidget::item {{ padding: 12px; border-radius: 4px; margin: 2px; color: {text_primary}; }}
-            QListWidget::item:selected {{ background-color: {selected_bg}; color: {selected_text}; }}
-            QListWidget::item:hover {{ background-color: {hover_bg}; color: {text_primary}; }}
-            QTextEdit {{ border: 2px solid {border_color}; border-radius: 6px; padding: 10px; background-color: {bg_input}; color: {text_primary}; }}
-            QTextEdit:focus {{ border: 2px solid #0078d4; }}
-            QTextBrowser {{ border: 2px solid {border_color}; border-radius: 6px; padding: 10px; background-color: {bg_input}; color: {text_primary}; }}
-            QTextBrowser:focus {{ border: 2px solid #0078d4; }}
-            QTextBrowser#viewGuideText {{ border: none; background-color: transparent; padding: 0px; }}
-            QTextBrowser#guideOutputView {{ border: 2px solid {border_color}; border-radius: 6px; padding: 10px; background-color: {bg_input}; }}
-            QPlainTextEdit#statusDisplay {{ border: 1px solid {border_color}; border-radius: 6px; padding: 8px; background-color: {bg_panel}; color: {text_primary}; }}
-            QPlainTextEdit#statusDisplay:focus {{ border: 1px solid {border_color}; }}
-            QScrollArea {{ border: none; background-color: {bg_panel}; }}
-            QScrollArea > QWidget > QWidget {{ background-color: {bg_panel}; }}
-            QScrollBar:vertical {{ border: none; background: {scrollbar_bg}; width: 10px; border-radius: 5px; }}
-            QScrollBar::handle:vertical {{ background: {scrollbar_handle}; border-radius: 5px; min-height: 20px; }}
-            QScrollBar::handle:vertical:hover {{ background: {scrollbar_hover}; }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0px; }}
-            QPushButton {{ background-color: #0078d4; color: white; border: none; border-radius: 6px; padding: 10px 20px; }}
-            QPushButton:hover {{ background-color: #006cbd; }}
-            QPushButton:pressed {{ background-color: #005a9e; }}
-            QPushButton:disabled {{ background-color: #cccccc; color: #666666; }}
-            QPushButton#deleteButton {{ background-color: #d32f2f; }}
-            QPushButton#deleteButton:hover {{ background-color: #b71c1c; }}
-            QPushButton#sortOrderButton {{ background-color: {bg_input}; color: {text_primary}; border: 1px solid {border_color}; border-radius: 4px; padding: 0px; }}
-            QPushButton#sortOrderButton:hover {{ background-color: {hover_bg}; }}
-            QToolButton#sortButton {{ background-color: {bg_input}; color: {text_primary}; border: 1px solid {border_color}; border-radius: 4px; padding: 5px 12px; }}
-            QToolButton#sortButton:hover {{ background-color: {hover_bg}; }}
-            QToolButton#sortButton::menu-indicator {{ image: none; width: 0px; }}
-            QComboBox {{ background-color: {bg_input}; color: {text_primary}; border: 2px solid {border_color}; border-radius: 4px; padding: 5px; }}
-            QComboBox:hover {{ border: 2px solid #0078d4; }}
-            QComboBox::drop-down {{ border: none; }}
-            QComboBox::down-arrow {{ image: none; border-left: 4px solid transparent; border-right: 4px solid transparent; border-top: 5px solid {text_primary}; margin-right: 5px; }}
-            QComboBox QAbstractItemView {{ background-color: {bg_input}; color: {text_primary}; selection-background-color: {selected_bg}; selection-color: {selected_text}; border: 1px solid {border_color}; }}
-            QLineEdit {{ background-color: {bg_input}; color: {text_primary}; border: 2px solid {border_color}; border-radius: 4px; padding: 5px; }}
-            QLineEdit:focus {{ border: 2px solid #0078d4; }}
-        """
-        )
+        # Repolish the whole widget tree with a single repaint at the end
+        with _updates_paused(self):
+            self.setStyleSheet(_build_stylesheet(current_theme))
 
     # ------------------------------------------------------------------
     # Settings persistence helpers
     # ------------------------------------------------------------------
+    def flush_state(self):
+        """Write any pending game library changes before the application exits."""
+        if self._save_timer.isActive():
+            self._flush_save()
+
+    @pyqtSlot()
+    def _flush_save(self):
+        """Write the game library to disk, cancelling any pending save"""
+        self._save_timer.stop()
+        if not self._library_loaded:
+            # Never let an empty placeholder overwrite the library on disk
+            return
+        self.data_manager.save_games(self.games)
+
+    @pyqtSlot()
     def _load_api_settings(self):
+        """Decrypt the stored API key into the top bar, once"""
+        if self._api_settings_loaded:
+            return
+        self._api_settings_loaded = True
         # Always use Gemini as the provider
         provider = "Gemini"
         self.settings["ai_provider"] = provider
         
         api_key = self.data_manager.load_api_key(provider)
-        if api_key:
-            self.api_key_input.setText(api_key)
-
+        # Keep a key the user typed before the stored one was loaded
+        if api_key and not self.api_key_input.text():
+            self._api_key_plain = api_key
+            # Loading the stored key is not an edit, so don't schedule a re-save
+            with _signals_blocked(self.api_key_input):
+                self.api_key_input.setText(api_key)
+
+    @pyqtSlot()
     def _on_api_key_changed(self):
+        self._api_key_plain = self.api_key_input.text().strip()
+        # Restarting the timer defers the save until typing pauses
+        self._api_save_timer.start()
+
+    @pyqtSlot()
+    def _flush_api_key(self):
+        """Persist the API key from the top bar, cancelling any pending save"""
+        self._api_save_timer.stop()
         # Always use Gemini
         provider = "Gemini"
         api_key = self.api_key_input.text().strip()
         if api_key:
             self.data_manager.save_api_key(provider, api_key)
 
+    @pyqtSlot()
+    def shutdown(self):
+        """Persist pending changes and stop background work before the application exits."""
+        if self._api_save_timer.isActive():
+            self._flush_api_key()
+        self.flush_state()
+        # Drop queued workers; running ones see their model races cancelled
+        self.thread_pool.clear()
+        self.ai_manager.close()
+
+    def closeEvent(self, event):
+        self.shutdown()
+        super().closeEvent(event)
+
+    @pyqtSlot()
     def _delete_current_game(self):
         if not self.current_game:
             return
@@ -1354,8 +1678,12 @@ Focus on giving them an EDGE, not basic walkthrough advice. Search for speedrun
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        self.games.pop(self.current_game, None)
+        title = self.current_game
+        self.games.pop(title, None)
         self.current_game = None
-        self.data_manager.save_games(self.games)
-        self._populate_game_list()
+        self._flush_save()
+
+        # Drop just the deleted row instead of rebuilding the whole list
+        self._unindex_title(title)
+        self.game_model.remove_row(self.game_model.row_of(title))
         self._set_details_enabled(False)
\ No newline at end of file
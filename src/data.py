@@ -8,11 +8,47 @@ and encryption functionality.
 
 import json
 import os
+import gzip
 import base64
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.backends import default_backend
+import hashlib
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Fixed application secret used to derive the API key encryption key
+KEY_SALT = b'game_tracker_salt_2025'
+KEY_SECRET = b'game_progress_tracker_key'
+# Base64 form of the Fernet version byte that starts every token
+FERNET_TOKEN_PREFIX = b'gAAAAA'
+# Game libraries larger than this are stored gzip-compressed in a .gz sibling
+GZIP_THRESHOLD = 256 * 1024
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def _dump_json(obj):
+    """Serialize obj to compact UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _load_json(data):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _atomic_write(path, data):
+    """Write bytes to a temporary file and swap it in so a crash never truncates path"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb', buffering=1 << 16) as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
 
 
 class DataManager:
@@ -20,48 +56,122 @@ class DataManager:
     
     def __init__(self):
         self.data_file = "game_progress.json"
+        self.compressed_data_file = self.data_file + ".gz"
         self.settings_file = "settings.json"
-        self.encryption_key = self._get_encryption_key()
+        # Created on first use so startup does not pay for the cryptography import
+        self.encryption_key = None
+        self.legacy_encryption_key = None
+        # Hash of the JSON last written to each file, used to skip no-op saves
+        self._written_hashes = {}
+        # Plaintext API keys known to be stored, by provider
+        self._stored_api_keys = {}
+        # Settings dict shared with the window; read from disk once
+        self._settings = None
+
+    def _write_json(self, path, obj, compressed_path=None, compress_over=None):
+        """Atomically write obj as compact JSON unless path already holds it
+
+        Output larger than compress_over bytes is gzip-compressed into
+        compressed_path instead; whichever of the two is not written is removed.
+        """
+        data = _dump_json(obj)
+        data_hash = hash(data)
+        if self._written_hashes.get(path) == data_hash:
+            return
+        target, stale = path, compressed_path
+        if compressed_path is not None and len(data) > compress_over:
+            # Fastest level: JSON still shrinks several times over
+            data = gzip.compress(data, compresslevel=1, mtime=0)
+            target, stale = compressed_path, path
+        _atomic_write(target, data)
+        if stale is not None and os.path.exists(stale):
+            os.remove(stale)
+        self._written_hashes[path] = data_hash
+
+    def _ensure_crypto(self):
+        """Return the Fernet instance, loading the cryptography stack on first use"""
+        if self.encryption_key is None:
+            self.encryption_key = self._get_encryption_key()
+        return self.encryption_key
+
+    def _ensure_legacy_crypto(self):
+        """Return the Fernet instance for keys stored before the HKDF switch"""
+        if self.legacy_encryption_key is None:
+            self.legacy_encryption_key = self._get_legacy_encryption_key()
+        return self.legacy_encryption_key
         
     def _get_encryption_key(self):
-        """Generate encryption key from a fixed salt"""
-        # In production, you might want to store this more securely
-        salt = b'game_tracker_salt_2025'
-        kdf = PBKDF2HMAC(
+        """Derive the encryption key from the fixed secret with HKDF"""
+        from cryptography.fernet import Fernet
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+        from cryptography.hazmat.backends import default_backend
+
+        # The secret is a constant, so PBKDF2-style stretching only costs CPU
+        hkdf = HKDF(
             algorithm=hashes.SHA256(),
             length=32,
-            salt=salt,
-            iterations=100000,
+            salt=KEY_SALT,
+            info=b'fernet',
             backend=default_backend()
         )
-        key = base64.urlsafe_b64encode(kdf.derive(b'game_progress_tracker_key'))
+        key = base64.urlsafe_b64encode(hkdf.derive(KEY_SECRET))
+        return Fernet(key)
+
+    def _get_legacy_encryption_key(self):
+        """Derive the legacy PBKDF2 key, only needed to migrate keys stored before HKDF"""
+        from cryptography.fernet import Fernet
+
+        # Same derivation as cryptography's PBKDF2HMAC, run in OpenSSL via hashlib
+        key = base64.urlsafe_b64encode(
+            hashlib.pbkdf2_hmac('sha256', KEY_SECRET, KEY_SALT, 100000, dklen=32)
+        )
         return Fernet(key)
     
     def encrypt_api_key(self, api_key: str) -> str:
         """Encrypt API key"""
         if not api_key:
             return ""
-        encrypted = self.encryption_key.encrypt(api_key.encode())
-        return base64.urlsafe_b64encode(encrypted).decode()
+        # Fernet tokens are already URL-safe base64 text
+        return self._ensure_crypto().encrypt(api_key.encode()).decode()
     
     def decrypt_api_key(self, encrypted_key: str) -> str:
         """Decrypt API key"""
         if not encrypted_key:
             return ""
         try:
-            decoded = base64.urlsafe_b64decode(encrypted_key.encode())
-            decrypted = self.encryption_key.decrypt(decoded)
-            return decrypted.decode()
+            return self._decrypt(encrypted_key)[0]
         except Exception as e:
             print(f"Error decrypting API key: {e}")
             return ""
+
+    def _decrypt(self, encrypted_key):
+        """Decrypt API key, also reporting whether it is stored in a legacy format"""
+        from cryptography.fernet import InvalidToken
+
+        token = encrypted_key.encode()
+        needs_upgrade = False
+        if not token.startswith(FERNET_TOKEN_PREFIX):
+            # Older versions wrapped the Fernet token in a second base64 layer
+            token = base64.urlsafe_b64decode(token)
+            needs_upgrade = True
+
+        try:
+            return self._ensure_crypto().decrypt(token).decode(), needs_upgrade
+        except InvalidToken:
+            return self._ensure_legacy_crypto().decrypt(token).decode(), True
     
     def load_games(self):
-        """Load games from JSON file"""
-        if os.path.exists(self.data_file):
+        """Load games from the newer of the plain and the compressed JSON file"""
+        paths = [path for path in (self.data_file, self.compressed_data_file) if os.path.exists(path)]
+        if paths:
             try:
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(max(paths, key=os.path.getmtime), 'rb') as f:
+                    data = f.read()
+                # Also covers plain-named files compressed by earlier versions
+                if data.startswith(GZIP_MAGIC):
+                    data = gzip.decompress(data)
+                return _load_json(data)
             except Exception as e:
                 print(f"Error loading games: {e}")
                 return {}
@@ -70,17 +180,23 @@ class DataManager:
     def save_games(self, games):
         """Save games to JSON file"""
         try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(games, f, indent=2, ensure_ascii=False)
+            self._write_json(self.data_file, games, compressed_path=self.compressed_data_file,
+                             compress_over=GZIP_THRESHOLD)
         except Exception as e:
             print(f"Error saving games: {e}")
     
     def load_settings(self):
-        """Load settings from JSON file"""
+        """Load settings, reading the JSON file only on first use"""
+        if self._settings is None:
+            self._settings = self._read_settings()
+        return self._settings
+
+    def _read_settings(self):
+        """Read settings from JSON file"""
         if os.path.exists(self.settings_file):
             try:
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
+                with open(self.settings_file, 'rb') as f:
+                    settings = _load_json(f.read())
                     
                 # Migrate old dark_mode boolean to new theme system
                 if "dark_mode" in settings and "theme" not in settings:
@@ -94,31 +210,58 @@ class DataManager:
                 return settings
             except Exception as e:
                 print(f"Error loading settings: {e}")
-                return {"theme": "Dark", "ai_provider": "Gemini", "api_key": ""}
-        return {"theme": "Dark", "ai_provider": "Gemini", "api_key": ""}
+                return {"theme": "Dark", "ai_provider": "Gemini"}
+        return {"theme": "Dark", "ai_provider": "Gemini"}
     
     def save_settings(self, settings):
         """Save settings to JSON file"""
+        self._settings = settings
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            self._write_json(self.settings_file, settings)
         except Exception as e:
             print(f"Error saving settings: {e}")
     
     def load_api_key(self, provider):
         """Load API key for the given provider"""
+        if provider in self._stored_api_keys:
+            return self._stored_api_keys[provider]
+
         settings = self.load_settings()
         encrypted_key = settings.get(f"{provider.lower()}_api_key")
-        if not encrypted_key:
+        from_legacy_field = not encrypted_key
+        if from_legacy_field:
             # Backwards compatibility for earlier single-key storage
             encrypted_key = settings.get("api_key", "")
-        return self.decrypt_api_key(encrypted_key)
+        elif "api_key" in settings:
+            # The provider key supersedes the duplicate older versions also wrote
+            del settings["api_key"]
+            self.save_settings(settings)
+        if not encrypted_key:
+            return ""
+
+        try:
+            api_key, needs_upgrade = self._decrypt(encrypted_key)
+        except Exception as e:
+            print(f"Error decrypting API key: {e}")
+            return ""
+
+        if needs_upgrade or from_legacy_field:
+            # Re-save keys stored with the old key derivation, encoding or field
+            self.save_api_key(provider, api_key)
+        else:
+            self._stored_api_keys[provider] = api_key
+        return api_key
     
     def save_api_key(self, provider, api_key):
         """Save API key for the given provider"""
+        if self._stored_api_keys.get(provider) == api_key:
+            # Fernet tokens differ on every encrypt, so only the plaintext shows a no-op
+            return
         settings = self.load_settings()
         encrypted_key = self.encrypt_api_key(api_key)
         settings[f"{provider.lower()}_api_key"] = encrypted_key
-        # Maintain legacy field for compatibility
-        settings["api_key"] = encrypted_key
-        self.save_settings(settings)
\ No newline at end of file
+        # The single-key field from older versions is superseded once a
+        # provider key is written; it is still read as a fallback above
+        settings.pop("api_key", None)
+        self.save_settings(settings)
+        self._stored_api_keys[provider] = api_key
\ No newline at end of file
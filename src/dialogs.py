@@ -13,8 +13,22 @@ from PyQt6.QtGui import QFont
 class AddGameDialog(QDialog):
     """Dialog for adding or renaming a game"""
 
+    # Shared fonts, created once a QApplication exists (see _init_fonts)
+    FONT_REGULAR = None
+    FONT_BOLD = None
+
+    @classmethod
+    def _init_fonts(cls):
+        if cls.FONT_REGULAR is not None:
+            return
+        cls.FONT_REGULAR = QFont("Segoe UI", 10)
+        cls.FONT_BOLD = QFont("Segoe UI", 10, QFont.Weight.Bold)
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._init_fonts()
+        # Styled by the main window stylesheet via these object names
+        self.setObjectName("addGameDialog")
         self.setWindowTitle("Add New Game")
         self.setModal(True)
         self.setMinimumWidth(400)
@@ -23,69 +37,27 @@ class AddGameDialog(QDialog):
         layout.setSpacing(15)
 
         title_label = QLabel("Enter Game Title:")
-        title_label.setFont(QFont("Segoe UI", 10))
+        title_label.setFont(self.FONT_REGULAR)
         layout.addWidget(title_label)
 
         self.title_input = QLineEdit()
         self.title_input.setPlaceholderText("e.g., The Legend of Zelda: Ocarina of Time")
-        self.title_input.setFont(QFont("Segoe UI", 10))
-        self.title_input.setStyleSheet(
-            """
-            QLineEdit {
-                padding: 10px;
-                border: 2px solid #e0e0e0;
-                border-radius: 6px;
-                background-color: white;
-                color: #202020;
-            }
-            QLineEdit:focus {
-                border: 2px solid #0078d4;
-            }
-            """
-        )
+        self.title_input.setFont(self.FONT_REGULAR)
+        self.title_input.setObjectName("titleInput")
         layout.addWidget(self.title_input)
 
         button_layout = QHBoxLayout()
         button_layout.addStretch()
 
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.setFont(QFont("Segoe UI", 10))
-        cancel_btn.setStyleSheet(
-            """
-            QPushButton {
-                padding: 8px 20px;
-                border: 1px solid #d0d0d0;
-                border-radius: 4px;
-                background-color: white;
-                color: #202020;
-            }
-            QPushButton:hover {
-                background-color: #f0f0f0;
-            }
-            """
-        )
+        cancel_btn.setFont(self.FONT_REGULAR)
+        cancel_btn.setObjectName("cancelButton")
         cancel_btn.clicked.connect(self.reject)
         cancel_btn.setAutoDefault(False)
 
         self.primary_button = QPushButton("Add Game")
-        self.primary_button.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        self.primary_button.setStyleSheet(
-            """
-            QPushButton {
-                padding: 8px 20px;
-                border: none;
-                border-radius: 4px;
-                background-color: #0078d4;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #006cbd;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-            """
-        )
+        self.primary_button.setFont(self.FONT_BOLD)
+        self.primary_button.setObjectName("primaryButton")
         self.primary_button.clicked.connect(self.accept)
         self.primary_button.setDefault(True)
 
@@ -95,21 +67,15 @@ class AddGameDialog(QDialog):
         layout.addLayout(button_layout)
         self.setLayout(layout)
 
-        self.setStyleSheet(
-            """
-            QDialog {
-                background-color: #f3f3f3;
-            }
-            QLabel {
-                color: #202020;
-            }
-            """
-        )
-
     def get_title(self):
         """Return the entered game title"""
         return self.title_input.text().strip()
 
+    def set_title(self, title):
+        """Prefill the title field and select it for quick replacement"""
+        self.title_input.setText(title)
+        self.title_input.selectAll()
+
     def set_primary_button_text(self, text):
         """Update the action button label"""
         self.primary_button.setText(text)
\ No newline at end of file
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Icon Resources Module
+
+Resolves bundled resource paths and caches QIcon instances so each image
+is only loaded from disk once per session.
+"""
+
+import os
+import sys
+import functools
+
+from PyQt6.QtCore import Qt, QResource
+from PyQt6.QtGui import QIcon, QImageReader, QPixmap
+
+# Resolved once at import; PyInstaller bundles extract resources to _MEIPASS
+_BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))
+)
+
+# Sizes requested by the title bar, taskbar and task switcher
+ICON_SIZES = (16, 24, 32, 48, 64, 256)
+
+
+@functools.lru_cache(maxsize=256)
+def resource_path(relative_path: str) -> str:
+    """Resolve resource paths for development and PyInstaller bundles."""
+    return os.path.join(_BASE_PATH, relative_path)
+
+
+def _read_pixmap(path: str) -> QPixmap:
+    """Decode an image using its file extension as the format hint."""
+    reader = QImageReader(path)
+    image_format = os.path.splitext(path)[1].lstrip(".").lower()
+    if image_format:
+        # Skip probing every registered image plugin for the format
+        reader.setFormat(image_format.encode())
+    return QPixmap.fromImage(reader.read())
+
+
+# Compiled Qt resource bundle (rcc -binary resources.qrc -o resources.rcc).
+# When present, images are served from the memory-mapped bundle instead of
+# individual files on disk.
+_RESOURCE_BUNDLE = "resources.rcc"
+_RESOURCE_PREFIX = ":/icons/"
+_RESOURCES_REGISTERED = QResource.registerResource(resource_path(_RESOURCE_BUNDLE))
+
+
+def _icon_source(name: str) -> str:
+    """Return the resource bundle path for an image, or its file path."""
+    if _RESOURCES_REGISTERED:
+        bundled = _RESOURCE_PREFIX + name
+        if QResource(bundled).isValid():
+            return bundled
+    return resource_path(name)
+
+
+@functools.lru_cache(maxsize=None)
+def get_icon(name: str) -> QIcon:
+    """Return a cached QIcon for the given bundled resource name.
+
+    The image is decoded once and pre-scaled to the standard platform sizes
+    so Qt does not re-decode the file for every size it asks for.
+    """
+    pixmap = _read_pixmap(_icon_source(name))
+    if pixmap.isNull():
+        return QIcon()
+
+    icon = QIcon()
+    for size in ICON_SIZES:
+        icon.addPixmap(
+            pixmap.scaled(
+                size,
+                size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+        )
+    return icon
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Item Models Module
+
+Contains Qt item models backing the application's list views.
+"""
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+
+class GameListModel(QAbstractListModel):
+    """List model exposing the game library titles in display order"""
+
+    def __init__(self, games, parent=None):
+        super().__init__(parent)
+        self._games = games
+        self._titles = []
+        # title -> row, rebuilt on demand after rows shift
+        self._rows = None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._titles)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        title = self._titles[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            # Add visual indicator for completed games
+            if self._games.get(title, {}).get("status", "In Progress") == "Completed":
+                return f"✅ {title}"
+            return title
+        if role == Qt.ItemDataRole.UserRole:
+            return title
+        return None
+
+    def title_at(self, row):
+        """Return the game title shown at the given row"""
+        return self._titles[row]
+
+    def row_of(self, title):
+        """Return the row showing the given game title"""
+        if self._rows is None:
+            self._rows = {t: row for row, t in enumerate(self._titles)}
+        return self._rows[title]
+
+    def set_titles(self, titles):
+        """Replace all rows with the given ordered titles"""
+        self.beginResetModel()
+        self._titles = list(titles)
+        self._rows = None
+        self.endResetModel()
+
+    def insert_title(self, row, title):
+        """Insert a single title at the given row"""
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._titles.insert(row, title)
+        self._rows = None
+        self.endInsertRows()
+
+    def rename_row(self, row, title):
+        """Replace the title at the given row in place"""
+        old_title = self._titles[row]
+        self._titles[row] = title
+        if self._rows is not None:
+            del self._rows[old_title]
+            self._rows[title] = row
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def remove_row(self, row):
+        """Remove the title at the given row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._titles[row]
+        self._rows = None
+        self.endRemoveRows()
+
+    def refresh_title(self, title):
+        """Notify views that the label for a title has changed"""
+        index = self.index(self.row_of(title))
+        self.dataChanged.emit(index, index)
@@ -5,17 +5,22 @@ Worker Threads Module
 Contains background worker classes for non-blocking operations.
 """
 
-from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 
 
-class GuideGenerationWorker(QObject):
-    """Worker thread for generating guide hints without freezing UI"""
+class GuideGenerationSignals(QObject):
+    """Signals emitted by GuideGenerationWorker back to the UI thread"""
 
     finished = pyqtSignal(dict)
     status_update = pyqtSignal(str)
 
-    def __init__(self, game_title, situation, objective, behavior, api_key, provider, ai_manager, parent=None):
-        super().__init__(parent)
+
+class GuideGenerationWorker(QRunnable):
+    """Thread pool task for generating guide hints without freezing UI"""
+
+    def __init__(self, game_title, situation, objective, behavior, api_key, provider, ai_manager, use_cache=True):
+        super().__init__()
+        self.signals = GuideGenerationSignals()
         self.game_title = game_title
         self.situation = situation
         self.objective = objective
@@ -23,6 +28,7 @@ class GuideGenerationWorker(QObject):
         self.api_key = api_key
         self.provider = provider
         self.ai_manager = ai_manager
+        self.use_cache = use_cache
 
     def run(self):
         """Execute the AI guide generation"""
@@ -34,8 +40,29 @@ class GuideGenerationWorker(QObject):
                 behavior=self.behavior,
                 api_key=self.api_key,
                 provider=self.provider,
-                status_callback=self.status_update.emit
+                status_callback=self.signals.status_update.emit,
+                use_cache=self.use_cache
             )
-            self.finished.emit(result)
+            self.signals.finished.emit(result)
         except Exception as exc:
-            self.finished.emit({"error": str(exc)})
\ No newline at end of file
+            self.signals.finished.emit({"error": str(exc)})
+
+
+class LibraryLoadSignals(QObject):
+    """Signals emitted by LibraryLoadWorker back to the UI thread"""
+
+    loaded = pyqtSignal(dict)
+
+
+class LibraryLoadWorker(QRunnable):
+    """Thread pool task that reads the saved game library off the UI thread"""
+
+    def __init__(self, data_manager):
+        super().__init__()
+        self.signals = LibraryLoadSignals()
+        self.data_manager = data_manager
+
+    def run(self):
+        """Load the library from disk"""
+        # load_games reports its own errors and falls back to an empty library
+        self.signals.loaded.emit(self.data_manager.load_games())